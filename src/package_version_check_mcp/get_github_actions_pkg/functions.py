@@ -1,11 +1,51 @@
+import asyncio
 import os
 from typing import Any, Optional
 
 import httpx
+import orjson
 import yaml
 
+from package_version_check_mcp.get_latest_versions_pkg.utils.http_client import get_http_client
+from package_version_check_mcp.get_latest_versions_pkg.utils.semaphores import get_semaphore
+from package_version_check_mcp.get_latest_versions_pkg.utils.ttl_cache import TTLCache
 from .structs import GitHubActionResult, GitHubActionError
 
+GITHUB_TIMEOUT_SECONDS = 30.0
+
+# The libyaml-based loader is much faster, but only available if PyYAML was built with libyaml
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Maximum number of concurrent requests to GitHub, across all tool calls
+GITHUB_MAX_CONCURRENT_REQUESTS = 8
+
+# How long (in seconds) the latest tag of a repository is cached
+LATEST_TAG_CACHE_TTL_SECONDS = 60.0
+
+# How long (in seconds) the action.yml and README of a tag are cached. Tags are mutable (major version tags
+# like "v4" are moved on every release), so the cached files must expire eventually.
+TAG_CONTENT_CACHE_TTL_SECONDS = 600.0
+
+_latest_tag_cache: TTLCache[tuple[str, str]] = TTLCache()
+_metadata_cache: TTLCache[dict[str, Any]] = TTLCache()
+_readme_cache: TTLCache[Optional[str]] = TTLCache()
+
+
+def _github_request_headers() -> dict[str, str]:
+    """Build the headers for GitHub requests, with optional GitHub PAT authentication.
+
+    The headers are sent with each request (rather than configured on the client), because the HTTP
+    client is shared with the other registries.
+
+    Returns:
+        The request headers
+    """
+    headers = {"Accept": "application/vnd.github.v3+json"}
+    github_pat = os.environ.get("GITHUB_PAT")
+    if github_pat:
+        headers["Authorization"] = f"token {github_pat}"
+    return headers
+
 
 async def fetch_github_action_latest_tag(
     owner: str, repo: str, client: httpx.AsyncClient
@@ -23,18 +63,28 @@ async def fetch_github_action_latest_tag(
     Raises:
         Exception: If tags cannot be fetched
     """
+    cached, is_fresh = _latest_tag_cache.get((owner, repo), LATEST_TAG_CACHE_TTL_SECONDS)
+    if is_fresh:
+        return cached
+
     # Use GitHub API to get tags
     url = f"https://api.github.com/repos/{owner}/{repo}/tags"
 
-    response = await client.get(url)
+    # We only need the first tag, so don't let GitHub send a full page of 30 tags
+    async with get_semaphore("github", GITHUB_MAX_CONCURRENT_REQUESTS):
+        response = await client.get(
+            url, params={"per_page": 1}, headers=_github_request_headers(), timeout=GITHUB_TIMEOUT_SECONDS
+        )
     response.raise_for_status()
-    tags = response.json()
+    tags = orjson.loads(response.content)
 
     if not tags:
         raise ValueError(f"No tags found for {owner}/{repo}")
 
     # Return the first (most recent) tag name and its commit SHA
-    return tags[0]["name"], tags[0]["commit"]["sha"]
+    latest_tag = tags[0]["name"], tags[0]["commit"]["sha"]
+    _latest_tag_cache.set((owner, repo), latest_tag)
+    return latest_tag
 
 
 async def fetch_github_action_metadata(
@@ -54,31 +104,41 @@ async def fetch_github_action_metadata(
     Raises:
         Exception: If action.yml cannot be fetched or parsed
     """
-    # Try action.yml first, then action.yaml
-    for filename in ["action.yml", "action.yaml"]:
+    cached, is_fresh = _metadata_cache.get((owner, repo, tag), TAG_CONTENT_CACHE_TTL_SECONDS)
+    if is_fresh:
+        return cached
+
+    async def fetch_file(filename: str) -> httpx.Response:
         url = f"https://raw.githubusercontent.com/{owner}/{repo}/{tag}/{filename}"
+        async with get_semaphore("github", GITHUB_MAX_CONCURRENT_REQUESTS):
+            return await client.get(url, headers=_github_request_headers(), timeout=GITHUB_TIMEOUT_SECONDS)
+
+    # Request action.yml and action.yaml concurrently, so that actions using the .yaml extension don't have to
+    # wait for the 404 of action.yml first. action.yml takes precedence if both exist.
+    responses = await asyncio.gather(fetch_file("action.yml"), fetch_file("action.yaml"), return_exceptions=True)
+
+    for response in responses:
+        if isinstance(response, BaseException):
+            raise response
+        if response.status_code == 404:
+            continue  # Try the next filename
+        response.raise_for_status()
 
-        try:
-            response = await client.get(url)
-            response.raise_for_status()
-
-            # Parse the YAML content
-            action_data = yaml.safe_load(response.text)
-
-            # Extract only the required fields
-            metadata = {}
-            if "inputs" in action_data:
-                metadata["inputs"] = action_data["inputs"]
-            if "outputs" in action_data:
-                metadata["outputs"] = action_data["outputs"]
-            if "runs" in action_data:
-                metadata["runs"] = action_data["runs"]
-
-            return metadata
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                continue  # Try the next filename
-            raise
+        # Parse the YAML content (directly from bytes, letting libyaml do the decoding) in a worker thread,
+        # so that parsing the action.yml files of many actions does not stall the event loop
+        action_data = await asyncio.to_thread(yaml.load, response.content, Loader=_YAML_LOADER)
+
+        # Extract only the required fields
+        metadata = {}
+        if "inputs" in action_data:
+            metadata["inputs"] = action_data["inputs"]
+        if "outputs" in action_data:
+            metadata["outputs"] = action_data["outputs"]
+        if "runs" in action_data:
+            metadata["runs"] = action_data["runs"]
+
+        _metadata_cache.set((owner, repo, tag), metadata)
+        return metadata
 
     raise ValueError(f"No action.yml or action.yaml found for {owner}/{repo}@{tag}")
 
@@ -100,16 +160,24 @@ async def fetch_github_action_readme(
     Raises:
         Exception: If there's an error fetching the README (other than 404)
     """
+    cached, is_fresh = _readme_cache.get((owner, repo, tag), TAG_CONTENT_CACHE_TTL_SECONDS)
+    if is_fresh:
+        return cached
+
     url = f"https://raw.githubusercontent.com/{owner}/{repo}/{tag}/README.md"
 
     try:
-        response = await client.get(url)
+        async with get_semaphore("github", GITHUB_MAX_CONCURRENT_REQUESTS):
+            response = await client.get(url, headers=_github_request_headers(), timeout=GITHUB_TIMEOUT_SECONDS)
         response.raise_for_status()
-        return response.text
+        readme = response.text
     except httpx.HTTPStatusError as e:
-        if e.response.status_code == 404:
-            return None  # README not found, which is acceptable
-        raise
+        if e.response.status_code != 404:
+            raise
+        readme = None  # README not found, which is acceptable
+
+    _readme_cache.set((owner, repo, tag), readme)
+    return readme
 
 
 async def fetch_github_action(
@@ -134,34 +202,28 @@ async def fetch_github_action(
 
         owner, repo = parts
 
-        # Prepare headers with optional GitHub PAT authentication
-        headers = {"Accept": "application/vnd.github.v3+json"}
-        github_pat = os.environ.get("GITHUB_PAT")
-        if github_pat:
-            headers["Authorization"] = f"token {github_pat}"
+        client = get_http_client()
 
-        async with httpx.AsyncClient(
-            timeout=30.0,
-            headers=headers,
-        ) as client:
-            # Fetch the latest tag and its commit SHA
-            latest_tag, commit_sha = await fetch_github_action_latest_tag(owner, repo, client)
+        # Fetch the latest tag and its commit SHA
+        latest_tag, commit_sha = await fetch_github_action_latest_tag(owner, repo, client)
 
-            # Fetch the action.yml metadata
+        # Fetch the action.yml metadata and (optionally) the README concurrently
+        if include_readme:
+            metadata, readme = await asyncio.gather(
+                fetch_github_action_metadata(owner, repo, latest_tag, client),
+                fetch_github_action_readme(owner, repo, latest_tag, client),
+            )
+        else:
             metadata = await fetch_github_action_metadata(owner, repo, latest_tag, client)
-
-            # Optionally fetch the README
             readme = None
-            if include_readme:
-                readme = await fetch_github_action_readme(owner, repo, latest_tag, client)
-
-            return GitHubActionResult(
-                name=action_name,
-                latest_version=latest_tag,
-                digest=commit_sha,
-                metadata=metadata,
-                readme=readme,
-            )
+
+        return GitHubActionResult(
+            name=action_name,
+            latest_version=latest_tag,
+            digest=commit_sha,
+            metadata=metadata,
+            readme=readme,
+        )
 
     except httpx.HTTPStatusError as e:
         error_msg = f"HTTP error {e.response.status_code}: {e.response.reason_phrase}"
@@ -1,11 +1,13 @@
 from typing import Any, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class GitHubActionResult(BaseModel):
     """Successful GitHub action lookup result."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     latest_version: str
     digest: str  # Commit SHA that the tag points to
@@ -16,6 +18,8 @@ class GitHubActionResult(BaseModel):
 class GitHubActionError(BaseModel):
     """Error during GitHub action lookup."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     error: str
 
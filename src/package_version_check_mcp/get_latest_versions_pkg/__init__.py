@@ -1,10 +1,11 @@
 """Get latest package versions from various ecosystems."""
 
-from .dispatcher import fetch_package_version
+from .dispatcher import fetch_package_version, fetch_package_versions
 from .structs import PackageVersionRequest, PackageVersionResult, PackageVersionError, Ecosystem
 
 __all__ = [
     "fetch_package_version",
+    "fetch_package_versions",
     "PackageVersionRequest",
     "PackageVersionResult",
     "PackageVersionError",
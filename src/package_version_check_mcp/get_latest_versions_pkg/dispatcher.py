@@ -1,5 +1,9 @@
 """Main dispatcher for fetching package versions across different ecosystems."""
 
+import asyncio
+from typing import Awaitable, Callable
+
+import aiohttp
 import httpx
 
 from .structs import PackageVersionResult, PackageVersionRequest, PackageVersionError, Ecosystem
@@ -15,6 +19,53 @@ from .fetchers import (
     fetch_go_version,
     fetch_php_version,
 )
+from .utils.semaphores import get_semaphore
+from .utils.ttl_cache import TTLCache
+
+# How long (in seconds) a successful lookup is served from the cache. Docker and Helm tags can be
+# re-pointed or pushed at any time, so they get a shorter TTL than the other registries.
+DEFAULT_CACHE_TTL_SECONDS = 3600.0
+CACHE_TTL_SECONDS = {
+    Ecosystem.Docker: 600.0,
+    Ecosystem.Helm: 600.0,
+}
+
+# The fetcher of each ecosystem, looked up once per request instead of walking an if/elif chain
+_FETCHERS: dict[Ecosystem, Callable[[PackageVersionRequest], Awaitable[PackageVersionResult]]] = {
+    Ecosystem.NPM: lambda request: fetch_npm_version(request.package_name),
+    Ecosystem.PyPI: lambda request: fetch_pypi_version(request.package_name),
+    Ecosystem.Docker: lambda request: fetch_docker_version(request.package_name, request.version_hint),
+    Ecosystem.NuGet: lambda request: fetch_nuget_version(request.package_name),
+    Ecosystem.MavenGradle: lambda request: fetch_maven_gradle_version(request.package_name),
+    Ecosystem.Helm: lambda request: fetch_helm_chart_version(request.package_name, request.version_hint),
+    Ecosystem.TerraformProvider: lambda request: fetch_terraform_provider_version(request.package_name),
+    Ecosystem.TerraformModule: lambda request: fetch_terraform_module_version(request.package_name),
+    Ecosystem.Go: lambda request: fetch_go_version(request.package_name),
+    Ecosystem.PHP: lambda request: fetch_php_version(request.package_name, request.version_hint),
+}
+
+# Maximum number of concurrent requests to the registry of an ecosystem, across all tool calls. The
+# CDN-backed NPM and PyPI registries tolerate more concurrent requests than the others.
+DEFAULT_MAX_CONCURRENT_REQUESTS = 8
+MAX_CONCURRENT_REQUESTS = {
+    Ecosystem.NPM: 16,
+    Ecosystem.PyPI: 16,
+}
+
+_version_cache: TTLCache[PackageVersionResult] = TTLCache()
+
+# How long (in seconds) a "package not found" error is served from the cache, so that repeated lookups of
+# misspelled packages (e.g. by an agent retrying in a loop) do not each cost a registry round trip
+NOT_FOUND_CACHE_TTL_SECONDS = 60.0
+
+_not_found_cache: TTLCache[PackageVersionError] = TTLCache()
+
+# For how long (in seconds) after its expiry a cached result is still served if the registry lookup fails with a
+# transient error (timeout, connection error, 5xx), instead of returning the error
+MAX_STALE_SECONDS = 24 * 3600.0
+
+# Lookups that are currently in progress, shared by concurrent requests for the same package
+_in_flight: dict[tuple, asyncio.Task[PackageVersionResult | PackageVersionError]] = {}
 
 
 async def fetch_package_version(
@@ -22,45 +73,148 @@ async def fetch_package_version(
 ) -> PackageVersionResult | PackageVersionError:
     """Fetch the latest version of a package from its ecosystem.
 
+    Successful results are cached in-process (see CACHE_TTL_SECONDS), and so are "package not found" errors
+    (see NOT_FOUND_CACHE_TTL_SECONDS). Concurrent lookups of the same package share a single registry query
+    (and its result, even if it is an error). If the registry is temporarily unavailable, a recently expired
+    result is returned instead of the error (see MAX_STALE_SECONDS).
+
+    Args:
+        request: The package version request
+
+    Returns:
+        Either a PackageVersionResult on success or PackageVersionError on failure
+    """
+    key = (request.ecosystem, request.package_name, request.version_hint)
+    ttl = CACHE_TTL_SECONDS.get(request.ecosystem, DEFAULT_CACHE_TTL_SECONDS)
+
+    cached, is_fresh = _version_cache.get(key, ttl)
+    if cached is not None and is_fresh:
+        return cached
+    not_found, is_fresh = _not_found_cache.get(key, NOT_FOUND_CACHE_TTL_SECONDS)
+    if not_found is not None and is_fresh:
+        return not_found
+
+    # Tasks are bound to their event loop, so a task left over from another loop (e.g. of a previous test)
+    # must not be awaited
+    task = _in_flight.get(key)
+    if task is None or task.get_loop() is not asyncio.get_running_loop():
+        task = asyncio.create_task(_fetch_and_cache_package_version(request, key))
+        _in_flight[key] = task
+        task.add_done_callback(lambda done: _in_flight.pop(key, None) if _in_flight.get(key) is done else None)
+
+    # Shielded, so that a cancelled caller does not cancel the lookup the other callers are waiting for
+    return await asyncio.shield(task)
+
+
+async def _fetch_and_cache_package_version(
+    request: PackageVersionRequest, key: tuple
+) -> PackageVersionResult | PackageVersionError:
+    """Fetch the latest version of a package and cache the result (or "package not found" error).
+
+    If the lookup fails with a transient error (see _is_transient_error()), a cached result that expired at
+    most MAX_STALE_SECONDS ago is returned instead of the error.
+
     Args:
         request: The package version request
+        key: The cache key of the request
 
     Returns:
         Either a PackageVersionResult on success or PackageVersionError on failure
     """
+    limit = MAX_CONCURRENT_REQUESTS.get(request.ecosystem, DEFAULT_MAX_CONCURRENT_REQUESTS)
     try:
-        if request.ecosystem == Ecosystem.NPM:
-            return await fetch_npm_version(request.package_name)
-        elif request.ecosystem == Ecosystem.Docker:
-            return await fetch_docker_version(request.package_name, request.version_hint)
-        elif request.ecosystem == Ecosystem.NuGet:
-            return await fetch_nuget_version(request.package_name)
-        elif request.ecosystem == Ecosystem.MavenGradle:
-            return await fetch_maven_gradle_version(request.package_name)
-        elif request.ecosystem == Ecosystem.Helm:
-            return await fetch_helm_chart_version(request.package_name, request.version_hint)
-        elif request.ecosystem == Ecosystem.TerraformProvider:
-            return await fetch_terraform_provider_version(request.package_name)
-        elif request.ecosystem == Ecosystem.TerraformModule:
-            return await fetch_terraform_module_version(request.package_name)
-        elif request.ecosystem == Ecosystem.Go:
-            return await fetch_go_version(request.package_name)
-        elif request.ecosystem == Ecosystem.PHP:
-            return await fetch_php_version(request.package_name, request.version_hint)
-        else:  # Ecosystem.PyPI:
-            return await fetch_pypi_version(request.package_name)
-    except httpx.HTTPStatusError as e:
-        error_msg = f"HTTP error {e.response.status_code}: {e.response.reason_phrase}"
-        if e.response.status_code == 404:
-            error_msg = f"Package '{request.package_name}' not found"
-        return PackageVersionError(
-            ecosystem=request.ecosystem,
-            package_name=request.package_name,
-            error=error_msg,
-        )
+        async with get_semaphore(request.ecosystem, limit):
+            result = await _fetch_package_version_uncached(request)
     except Exception as e:
-        return PackageVersionError(
-            ecosystem=request.ecosystem,
-            package_name=request.package_name,
-            error=f"Failed to fetch package version: {str(e)}",
-        )
+        if _is_transient_error(e):
+            # Serve the stale result rather than failing while the registry is (briefly) unavailable
+            ttl = CACHE_TTL_SECONDS.get(request.ecosystem, DEFAULT_CACHE_TTL_SECONDS)
+            cached, is_within_max_stale = _version_cache.get(key, ttl + MAX_STALE_SECONDS)
+            if cached is not None and is_within_max_stale:
+                return cached
+
+        error = _to_package_version_error(request, e)
+        if isinstance(e, httpx.HTTPStatusError) and e.response.status_code == 404:
+            _not_found_cache.set(key, error)
+        return error
+
+    _version_cache.set(key, result)
+    return result
+
+
+async def _fetch_package_version_uncached(request: PackageVersionRequest) -> PackageVersionResult:
+    """Fetch the latest version of a package from its ecosystem, bypassing the cache.
+
+    Args:
+        request: The package version request
+
+    Returns:
+        The PackageVersionResult
+
+    Raises:
+        Exception: If the lookup fails
+    """
+    return await _FETCHERS[request.ecosystem](request)
+
+
+def _is_transient_error(error: Exception) -> bool:
+    """Check whether a lookup failed because the registry was (probably only briefly) unreachable or overloaded.
+
+    Timeouts, connection errors and 5xx responses are transient, anything else (e.g. a 404) is not.
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status >= 500
+    return isinstance(error, (httpx.TransportError, aiohttp.ClientConnectionError, TimeoutError, ConnectionError))
+
+
+def _to_package_version_error(request: PackageVersionRequest, error: Exception) -> PackageVersionError:
+    """Convert the exception of a failed lookup into a PackageVersionError.
+
+    Args:
+        request: The package version request
+        error: The exception raised by the fetcher
+
+    Returns:
+        The PackageVersionError
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        error_msg = f"HTTP error {error.response.status_code}: {error.response.reason_phrase}"
+        if error.response.status_code == 404:
+            error_msg = f"Package '{request.package_name}' not found"
+    else:
+        error_msg = f"Failed to fetch package version: {str(error)}"
+    return PackageVersionError(
+        ecosystem=request.ecosystem,
+        package_name=request.package_name,
+        error=error_msg,
+    )
+
+
+async def fetch_package_versions(
+    requests: list[PackageVersionRequest], max_concurrency: int = 10
+) -> list[PackageVersionResult | PackageVersionError]:
+    """Fetch the latest versions of several packages concurrently.
+
+    At most max_concurrency lookups are in flight at the same time, to avoid overloading the registries.
+    Duplicate requests (e.g. from aggregated dependency trees) are only looked up once.
+
+    Args:
+        requests: The package version requests
+        max_concurrency: Maximum number of concurrent lookups
+
+    Returns:
+        One PackageVersionResult or PackageVersionError per request, in the same order as the requests
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch_with_limit(request: PackageVersionRequest) -> PackageVersionResult | PackageVersionError:
+        async with semaphore:
+            return await fetch_package_version(request)
+
+    unique_requests = {(req.ecosystem, req.package_name, req.version_hint): req for req in requests}
+    unique_results = await asyncio.gather(*[fetch_with_limit(req) for req in unique_requests.values()])
+
+    result_by_key = dict(zip(unique_requests, unique_results))
+    return [result_by_key[(req.ecosystem, req.package_name, req.version_hint)] for req in requests]
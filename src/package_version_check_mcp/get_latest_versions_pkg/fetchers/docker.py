@@ -1,19 +1,104 @@
 """Docker image version fetcher."""
 
-from typing import Optional
+import asyncio
+import logging
+import time
+from typing import Callable, Optional
 import urllib.parse
 
 from docker_registry_client_async import DockerRegistryClientAsync, ImageName
-from aiohttp import ClientResponseError
+from aiohttp import ClientError, ClientResponseError
 from yarl import URL
 
 from ..structs import PackageVersionResult, Ecosystem
-from ..utils.version_parser import parse_docker_tag
+from ..utils.http_client import close_on_previous_loop
+from ..utils.version_parser import parse_docker_tag, ParsedDockerTag
 
+logger = logging.getLogger(__name__)
 
-async def fetch_docker_version(
-    package_name: str, tag_hint: Optional[str] = None
-) -> PackageVersionResult:
+# Number of tags requested per page when a registry paginates its tag list
+TAG_LIST_PAGE_SIZE = 1000
+
+
+# The registry client caches auth tokens without honoring their expiry (e.g. 5 minutes for Docker Hub),
+# so the client (and with it its cached tokens) is replaced after this many seconds
+REGISTRY_TOKEN_MAX_AGE_SECONDS = 240.0
+
+# How long (in seconds) a replaced registry client is kept open, so that lookups still using it can finish
+RETIRED_REGISTRY_CLIENT_CLOSE_DELAY_SECONDS = 60.0
+
+_registry_client: Optional[DockerRegistryClientAsync] = None
+_registry_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_registry_client_created_at: float = 0.0
+# The delayed close tasks of replaced registry clients (keeps a reference, so they are not garbage collected)
+_retired_registry_clients: dict[DockerRegistryClientAsync, asyncio.Task] = {}
+
+
+def _retire_registry_client(registry_client: DockerRegistryClientAsync) -> None:
+    """Close a replaced registry client of the running loop, once the lookups still using it had time to finish."""
+
+    async def close_later() -> None:
+        await asyncio.sleep(RETIRED_REGISTRY_CLIENT_CLOSE_DELAY_SECONDS)
+        await registry_client.close()
+
+    task = asyncio.create_task(close_later())
+    _retired_registry_clients[registry_client] = task
+    task.add_done_callback(lambda _: _retired_registry_clients.pop(registry_client, None))
+
+
+def get_registry_client() -> DockerRegistryClientAsync:
+    """Return the shared DockerRegistryClientAsync, creating it on first use.
+
+    Reusing one client keeps the connections and auth tokens of the registries, which saves the
+    token negotiation round trips on repeated lookups. Like the shared httpx client, it is bound to
+    the event loop it was created on (the client of a previous loop is closed, see close_on_previous_loop()),
+    and no lock is needed because creating it involves no await. Because the client never expires its
+    cached tokens, it is replaced by a new one after REGISTRY_TOKEN_MAX_AGE_SECONDS.
+
+    Returns:
+        The shared DockerRegistryClientAsync
+    """
+    global _registry_client, _registry_client_loop, _registry_client_created_at
+
+    loop = asyncio.get_running_loop()
+    if _registry_client is not None:
+        if _registry_client_loop is not loop:
+            close_on_previous_loop(_registry_client.close, _registry_client_loop)
+            _registry_client = None
+        elif time.monotonic() - _registry_client_created_at > REGISTRY_TOKEN_MAX_AGE_SECONDS:
+            _retire_registry_client(_registry_client)
+            _registry_client = None
+
+    if _registry_client is None:
+        _registry_client = DockerRegistryClientAsync()
+        _registry_client_loop = loop
+        _registry_client_created_at = time.monotonic()
+
+    return _registry_client
+
+
+async def aclose_registry_client() -> None:
+    """Close the shared DockerRegistryClientAsync (if any), e.g. when the MCP server shuts down."""
+    global _registry_client, _registry_client_loop
+
+    registry_client = _registry_client
+    _registry_client = None
+    _registry_client_loop = None
+
+    if registry_client is not None:
+        await registry_client.close()
+
+    # Close the replaced clients right away, instead of waiting for their delayed close
+    for retired_client, task in list(_retired_registry_clients.items()):
+        task.cancel()
+        await retired_client.close()
+
+
+# Number of tags above which the latest tag is determined in a worker thread
+THREADED_TAG_SELECTION_THRESHOLD = 2000
+
+
+async def fetch_docker_version(package_name: str, tag_hint: Optional[str] = None) -> PackageVersionResult:
     """Fetch the latest version tag of a Docker image.
 
     Args:
@@ -31,50 +116,123 @@ async def fetch_docker_version(
     # Parse the image name
     image_name = ImageName.parse(package_name)
 
-    async with DockerRegistryClientAsync() as registry_client:
+    registry_client = get_registry_client()
+
+    # With a tag hint, the latest tag of the first page is likely the overall latest one, so if there are more
+    # pages, we speculatively fetch its digest while the remaining pages are being retrieved
+    speculative_candidate: Optional[str] = None
+    speculative_digest: Optional[asyncio.Task[Optional[str]]] = None
+
+    async def fetch_speculative_digest(first_page_tags: list[str]) -> Optional[str]:
+        nonlocal speculative_candidate
+        speculative_candidate = await _determine_latest_image_tag_offloaded(first_page_tags, tag_hint)
+        if not speculative_candidate:
+            return None
+        return await get_manifest_digest(registry_client, image_name, speculative_candidate)
+
+    def speculate(first_page_tags: list[str]) -> None:
+        nonlocal speculative_digest
+        speculative_digest = asyncio.create_task(fetch_speculative_digest(first_page_tags))
+
+    try:
         # Get all available tags
-        tags = await get_docker_image_tags(image_name, registry_client)
+        tags = await get_docker_image_tags(
+            image_name, registry_client, on_first_page=speculate if tag_hint else None
+        )
 
         if not tags:
             raise Exception(f"No tags found for image '{package_name}'")
 
         # Determine the latest compatible version
-        latest_tag = determine_latest_image_tag(tags, tag_hint)
+        latest_tag = await _determine_latest_image_tag_offloaded(tags, tag_hint)
 
         if not latest_tag:
             hint_msg = f" compatible with '{tag_hint}'" if tag_hint else ""
             raise Exception(f"No valid version tags{hint_msg} found for image '{package_name}'")
 
         # Get the manifest digest for this tag
-        image_with_tag = image_name.clone()
-        image_with_tag.set_tag(latest_tag)
-
-        try:
-            manifest = await registry_client.head_manifest(image_with_tag)
-            # Get digest from the head_manifest response
-            digest = str(manifest.digest) if manifest.digest else None
-        except Exception:
-            # If we can't get the manifest, proceed without digest
-            digest = None
-
-        return PackageVersionResult(
-            ecosystem=Ecosystem.Docker,
-            package_name=package_name,
-            latest_version=latest_tag,
-            digest=digest,
-            published_on=None,  # Docker doesn't expose this easily via registry API
-        )
+        if speculative_digest is not None and speculative_candidate == latest_tag:
+            digest = await speculative_digest
+        else:
+            digest = await get_manifest_digest(registry_client, image_name, latest_tag)
+    finally:
+        if speculative_digest is not None:
+            # Wait for the cancelled task, so that its exception (if any) is retrieved instead of being logged
+            speculative_digest.cancel()
+            await asyncio.gather(speculative_digest, return_exceptions=True)
+
+    return PackageVersionResult(
+        ecosystem=Ecosystem.Docker,
+        package_name=package_name,
+        latest_version=latest_tag,
+        digest=digest,
+        published_on=None,  # Docker doesn't expose this easily via registry API
+    )
+
+
+async def _determine_latest_image_tag_offloaded(tags: list[str], tag_hint: Optional[str]) -> Optional[str]:
+    """Call determine_latest_image_tag(), in a worker thread for huge tag lists.
+
+    This keeps the CPU-bound parsing of thousands of tags from blocking other lookups running on the event loop.
+    """
+    if len(tags) > THREADED_TAG_SELECTION_THRESHOLD:
+        return await asyncio.to_thread(determine_latest_image_tag, tags, tag_hint)
+    return determine_latest_image_tag(tags, tag_hint)
+
+
+async def get_manifest_digest(
+    registry_client: DockerRegistryClientAsync, image_name: ImageName, tag: str
+) -> Optional[str]:
+    """Get the manifest digest of an image tag.
+
+    Args:
+        registry_client: The Docker registry client
+        image_name: The parsed Docker image name
+        tag: The tag whose manifest digest to get
+
+    Returns:
+        The manifest digest, or None if it could not be retrieved
+    """
+    image_with_tag = image_name.clone()
+    image_with_tag.set_tag(tag)
+
+    try:
+        manifest = await registry_client.head_manifest(image_with_tag)
+    except (ClientError, asyncio.TimeoutError) as e:
+        # If we can't get the manifest, proceed without digest
+        logger.debug("head_manifest failed for '%s': %s", image_with_tag, e)
+        return None
+
+    # The digest is a FormattedSHA256, which already is a str
+    digest = manifest.digest
+    if not digest:
+        return None
+    return digest if isinstance(digest, str) else str(digest)
+
+
+def _suggested_page_size(query: dict[str, list[str]]) -> int:
+    """Return the page size ("n") of a parsed tag list pagination query, or 0 if it is not numeric."""
+    try:
+        return int(query["n"][0])
+    except (KeyError, IndexError, ValueError):
+        return 0
 
 
-async def get_docker_image_tags(image_name: ImageName, registry_client: DockerRegistryClientAsync) -> list[str]:
+async def get_docker_image_tags(
+    image_name: ImageName,
+    registry_client: DockerRegistryClientAsync,
+    on_first_page: Optional[Callable[[list[str]], None]] = None,
+) -> list[str]:
     """Get all tags for a Docker image, handling pagination.
 
     Args:
         image_name: The parsed Docker image name
         registry_client: The Docker registry client
+        on_first_page: Optional callback that is called with the tags of the first page, before any
+                    further pages are retrieved. It is not called if there are no further pages.
 
     Returns:
-        List of all tags for the image
+        List of all tags for the image, without duplicates
     """
     # First pass, which may return all results (e.g. for Docker Hub) but maybe also only partial results
     # (if tag_list_response.client_response.links is non-empty)
@@ -87,26 +245,44 @@ async def get_docker_image_tags(image_name: ImageName, registry_client: DockerRe
 
     tags: list[ImageName] = []
     tags.extend(tag_list_response.tags)
+    if on_first_page is not None and "next" in tag_list_response.client_response.links:
+        on_first_page([tag.tag for tag in tag_list_response.tags])  # type: ignore
+
+    # Second pass, retrieving additional tags when pagination is needed. The "last" cursor of each page is
+    # only known once the previous page has arrived, so pages cannot be requested concurrently. Instead, we
+    # ask for larger pages than the registry suggests, reducing the number of sequential round trips.
+    page_size: Optional[int] = TAG_LIST_PAGE_SIZE
+    while "next" in tag_list_response.client_response.links:
+        next_link: dict[str, URL] = tag_list_response.client_response.links["next"]
+        if "url" not in next_link or not next_link["url"].query_string:
+            break
 
-    # Second pass, retrieving additional tags when pagination is needed
-    while True:
-        if "next" in tag_list_response.client_response.links:
-            next_link: dict[str, URL] = tag_list_response.client_response.links["next"]
+        query = next_link["url"].query_string  # example: 'n=100&last=v0.45.0-amd64'
+        result = urllib.parse.parse_qs(query)
+        if "n" not in result or "last" not in result:
+            break
 
-            if "url" in next_link and next_link["url"].query_string:
-                query = next_link["url"].query_string  # example: 'n=100&last=v0.45.0-amd64'
-                result = urllib.parse.parse_qs(query)
-                if "n" not in result or "last" not in result:
-                    break
+        if page_size is not None and _suggested_page_size(result) < page_size:
+            try:
+                tag_list_response = await registry_client.get_tag_list(
+                    image_name, n=[str(page_size)], last=result["last"]
+                )
+            except ClientResponseError as e:
+                # Registries may reject page sizes above their own limit, in which case we follow their links
+                if e.status != 400:
+                    raise
+                page_size = None
                 tag_list_response = await registry_client.get_tag_list(image_name, **result)
-                tags.extend(tag_list_response.tags)
-            else:
-                break
         else:
-            break
+            tag_list_response = await registry_client.get_tag_list(image_name, **result)
+        tags.extend(tag_list_response.tags)
+
+    return _unique_tags(tags)
 
-    tags_as_strings: list[str] = [tag.tag for tag in tags]  # type: ignore
-    return tags_as_strings
+
+def _unique_tags(tags: list[ImageName]) -> list[str]:
+    """Convert image names to their tags, dropping duplicates (e.g. of tags that were pushed while paginating)."""
+    return list(dict.fromkeys(tag.tag for tag in tags))  # type: ignore
 
 
 def determine_latest_image_tag(available_tags: list[str], tag_hint: Optional[str] = None) -> Optional[str]:
@@ -129,70 +305,70 @@ def determine_latest_image_tag(available_tags: list[str], tag_hint: Optional[str
         >>> determine_latest_image_tag(['3.7.0', '3.8.0-alpine'], '3.7.0-alpine')
         None
     """
-    def is_stable(parsed: dict) -> bool:
+    def is_stable(parsed: ParsedDockerTag) -> bool:
         """Check if a version is stable (no prerelease marker)."""
-        return not parsed['prerelease']
+        return not parsed.prerelease
 
-    def version_sort_key(parsed: dict) -> tuple:
-        """Generate a sort key for version comparison.
+    def version_sort_key(parsed: ParsedDockerTag) -> tuple:
+        """Generate a key for version comparison.
 
-        Returns a tuple that can be used for sorting:
-        - release parts (padded to same length)
-        - prerelease (empty string sorts after non-empty, for stable versions)
-        - suffix (reversed for proper ordering)
+        Returns a tuple that can be compared (e.g. by max()):
+        - release parts (already padded to the same length by parse_docker_tag())
+        - whether the version is stable (stable versions sort after prerelease versions)
+        - prerelease
         """
-        # Pad release to consistent length for comparison
-        release = parsed['release'] + [0] * (10 - len(parsed['release']))
-
-        # Empty prerelease (stable) should sort after prerelease versions
-        # We invert this by using tuple ordering
-        prerelease_key = (not parsed['prerelease'], parsed['prerelease'])
+        return (parsed.release, not parsed.prerelease, parsed.prerelease)
+
+    # Parse the hint to determine compatibility requirements (matching suffix only)
+    hint_parsed = None
+    required_ending: Optional[str] = None
+    if tag_hint is not None:
+        hint_parsed = parse_docker_tag(tag_hint)
+        if not hint_parsed:
+            return None
+        # Compatible tags must end with the suffix of the hint (or contain no '-' at all, if the hint has no
+        # suffix), which is checked before parsing, to skip the tags of other variants cheaply
+        required_ending = f"-{hint_parsed.suffix}" if hint_parsed.suffix else None
+
+    # Track the latest tag of each category in a single pass over the tags, instead of building
+    # filtered lists. Each entry is a (key, original tag) pair; on ties, the tag listed last wins.
+    best_any = best_no_suffix = best_stable = best_stable_no_suffix = None
 
-        return (release, prerelease_key)
-
-    # Parse all tags
-    parsed_tags = []
     for tag in available_tags:
-        parsed = parse_docker_tag(tag)
-        if parsed:
-            parsed_tags.append(parsed)
+        if hint_parsed is not None:
+            if required_ending is not None:
+                if not tag.endswith(required_ending):
+                    continue
+            elif '-' in tag:
+                continue
 
-    if not parsed_tags:
-        return None
-
-    # If no hint provided, find the latest stable version overall
-    if tag_hint is None:
-        # Prefer stable versions
-        stable_tags = [p for p in parsed_tags if is_stable(p)]
-        candidates = stable_tags if stable_tags else parsed_tags
-
-        # Among stable versions, prefer those without suffixes
-        no_suffix_candidates = [p for p in candidates if not p['suffix']]
-        if no_suffix_candidates:
-            candidates = no_suffix_candidates
-
-        # Sort and return the latest
-        candidates.sort(key=version_sort_key)
-        return candidates[-1]['original']
-
-    # Parse the hint to determine compatibility requirements
-    hint_parsed = parse_docker_tag(tag_hint)
-    if not hint_parsed:
+        parsed = parse_docker_tag(tag)
+        if not parsed:
+            continue
+        if hint_parsed is not None and parsed.suffix != hint_parsed.suffix:
+            continue
+
+        entry = (version_sort_key(parsed), parsed.original)
+        if best_any is None or entry[0] >= best_any[0]:
+            best_any = entry
+        if not parsed.suffix and (best_no_suffix is None or entry[0] >= best_no_suffix[0]):
+            best_no_suffix = entry
+        if is_stable(parsed):
+            if best_stable is None or entry[0] >= best_stable[0]:
+                best_stable = entry
+            if not parsed.suffix and (best_stable_no_suffix is None or entry[0] >= best_stable_no_suffix[0]):
+                best_stable_no_suffix = entry
+
+    if best_any is None:
         return None
 
-    # Find compatible versions (matching suffix only)
-    hint_suffix = hint_parsed['suffix']
-    compatible = [p for p in parsed_tags if p['suffix'] == hint_suffix]
-
-    if not compatible:
-        return None
+    # If no hint provided, find the latest stable version overall, preferring those without suffixes
+    if hint_parsed is None:
+        if best_stable is not None:
+            return (best_stable_no_suffix or best_stable)[1]
+        return (best_no_suffix or best_any)[1]
 
     # If hint is stable, prefer stable compatible versions
-    if is_stable(hint_parsed):
-        stable_compatible = [p for p in compatible if is_stable(p)]
-        if stable_compatible:
-            compatible = stable_compatible
-
-    # Sort and return the latest compatible version
-    compatible.sort(key=version_sort_key)
-    return compatible[-1]['original']
+    if is_stable(hint_parsed) and best_stable is not None:
+        return best_stable[1]
+    return best_any[1]
@@ -1,8 +1,9 @@
 """Go module version fetcher."""
 
-import httpx
+import orjson
 
 from ..structs import PackageVersionResult, Ecosystem
+from ..utils.http_client import get_http_client
 
 
 async def fetch_go_version(package_name: str) -> PackageVersionResult:
@@ -19,24 +20,24 @@ async def fetch_go_version(package_name: str) -> PackageVersionResult:
     """
     url = f"https://proxy.golang.org/{package_name}/@latest"
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.get(url)
-        response.raise_for_status()
-        data = response.json()
-
-        version = data.get("Version")
-        published_on = data.get("Time")
-
-        # Try to get hash from Origin if available
-        digest = None
-        origin = data.get("Origin")
-        if origin and isinstance(origin, dict):
-            digest = origin.get("Hash")
-
-        return PackageVersionResult(
-            ecosystem=Ecosystem.Go,
-            package_name=package_name,
-            latest_version=version,
-            digest=digest,
-            published_on=published_on,
-        )
+    client = get_http_client()
+    response = await client.get(url)
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+
+    version = data.get("Version")
+    published_on = data.get("Time")
+
+    # Try to get hash from Origin if available
+    digest = None
+    origin = data.get("Origin")
+    if origin and isinstance(origin, dict):
+        digest = origin.get("Hash")
+
+    return PackageVersionResult(
+        ecosystem=Ecosystem.Go,
+        package_name=package_name,
+        latest_version=version,
+        digest=digest,
+        published_on=published_on,
+    )
@@ -2,18 +2,18 @@
 
 from typing import Optional
 import urllib.parse
-import httpx
 import tempfile
 import os
 import asyncio
 import json
 import functools
 
-from docker_registry_client_async import DockerRegistryClientAsync, ImageName
+from docker_registry_client_async import ImageName
 
 from ..structs import PackageVersionResult, Ecosystem
 from ..utils.version_parser import compare_semver, parse_semver
-from .docker import get_docker_image_tags, determine_latest_image_tag
+from ..utils.http_client import get_http_client
+from .docker import get_docker_image_tags, determine_latest_image_tag, get_manifest_digest, get_registry_client
 
 
 def parse_helm_chart_name(package_name: str) -> tuple[str, str, str]:
@@ -143,15 +143,15 @@ async def fetch_helm_chartmuseum_version(
     # into memory
     temp_file = None
     try:
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            async with client.stream('GET', index_url) as response:
-                response.raise_for_status()
+        client = get_http_client()
+        async with client.stream('GET', index_url, timeout=30.0, follow_redirects=True) as response:
+            response.raise_for_status()
 
-                # Create temp file and stream response to it
-                temp_file = tempfile.NamedTemporaryFile(mode='wb', suffix='.yaml', delete=False)
-                async for chunk in response.aiter_bytes(chunk_size=8192):
-                    temp_file.write(chunk)
-                temp_file.close()
+            # Create temp file and stream response to it
+            temp_file = tempfile.NamedTemporaryFile(mode='wb', suffix='.yaml', delete=False)
+            async for chunk in response.aiter_bytes(chunk_size=8192):
+                temp_file.write(chunk)
+            temp_file.close()
 
         # Use yq to extract only the specific chart (much faster than parsing entire YAML)
         chart_versions = await _extract_helm_chart_with_yq(temp_file.name, chart_name)
@@ -229,37 +229,30 @@ async def fetch_helm_oci_version(
     # Parse as a Docker image name
     image_name = ImageName.parse(full_image_name)
 
-    async with DockerRegistryClientAsync() as registry_client:
-        # Get all available tags (versions)
-        tags = await get_docker_image_tags(image_name, registry_client)
+    registry_client = get_registry_client()
+    # Get all available tags (versions)
+    tags = await get_docker_image_tags(image_name, registry_client)
 
-        if not tags:
-            raise Exception(f"No versions found for Helm chart '{original_package_name}'")
+    if not tags:
+        raise Exception(f"No versions found for Helm chart '{original_package_name}'")
 
-        # Determine the latest compatible version using the same logic as Docker
-        latest_tag = determine_latest_image_tag(tags, version_hint)
+    # Determine the latest compatible version using the same logic as Docker
+    latest_tag = determine_latest_image_tag(tags, version_hint)
 
-        if not latest_tag:
-            hint_msg = f" compatible with '{version_hint}'" if version_hint else ""
-            raise Exception(f"No valid version tags{hint_msg} found for Helm chart '{original_package_name}'")
+    if not latest_tag:
+        hint_msg = f" compatible with '{version_hint}'" if version_hint else ""
+        raise Exception(f"No valid version tags{hint_msg} found for Helm chart '{original_package_name}'")
 
-        # Get the manifest digest for this tag
-        image_with_tag = image_name.clone()
-        image_with_tag.set_tag(latest_tag)
+    # Get the manifest digest for this tag
+    digest = await get_manifest_digest(registry_client, image_name, latest_tag)
 
-        try:
-            manifest = await registry_client.head_manifest(image_with_tag)
-            digest = str(manifest.digest) if manifest.digest else None
-        except Exception:
-            digest = None
-
-        return PackageVersionResult(
-            ecosystem=Ecosystem.Helm,
-            package_name=original_package_name,
-            latest_version=latest_tag,
-            digest=digest,
-            published_on=None,  # OCI registries don't expose this easily
-        )
+    return PackageVersionResult(
+        ecosystem=Ecosystem.Helm,
+        package_name=original_package_name,
+        latest_version=latest_tag,
+        digest=digest,
+        published_on=None,  # OCI registries don't expose this easily
+    )
 
 
 async def _extract_helm_chart_with_yq(yaml_file_path: str, chart_name: str) -> list[dict]:
@@ -1,9 +1,9 @@
 """Maven/Gradle package version fetcher."""
 
-import httpx
 import xml.etree.ElementTree as ET
 
 from ..structs import PackageVersionResult, Ecosystem
+from ..utils.http_client import get_http_client
 
 
 def parse_maven_package_name(package_name: str) -> tuple[str, str, str]:
@@ -93,32 +93,32 @@ async def fetch_maven_gradle_version(package_name: str) -> PackageVersionResult:
     # Construct maven-metadata.xml URL
     metadata_url = f"{registry}/{group_path}/{artifact_id}/maven-metadata.xml"
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.get(metadata_url)
-        response.raise_for_status()
-
-        # Parse the XML response
-        root = ET.fromstring(response.text)
-
-        # Look for <versioning><release>...</release></versioning>
-        versioning = root.find("versioning")
-        if versioning is None:
-            raise Exception(f"No versioning information found for package '{package_name}'")
-
-        release = versioning.find("release")
-        if release is None or not release.text:
-            # Fall back to <latest> if <release> is not available
-            latest = versioning.find("latest")
-            if latest is None or not latest.text:
-                raise Exception(f"No release or latest version found for package '{package_name}'")
-            version = latest.text
-        else:
-            version = release.text
-
-        return PackageVersionResult(
-            ecosystem=Ecosystem.MavenGradle,
-            package_name=package_name,
-            latest_version=version,
-            digest=None,  # Not reliably available from maven-metadata.xml
-            published_on=None,  # Not reliably available from maven-metadata.xml
-        )
+    client = get_http_client()
+    response = await client.get(metadata_url)
+    response.raise_for_status()
+
+    # Parse the XML response
+    root = ET.fromstring(response.text)
+
+    # Look for <versioning><release>...</release></versioning>
+    versioning = root.find("versioning")
+    if versioning is None:
+        raise Exception(f"No versioning information found for package '{package_name}'")
+
+    release = versioning.find("release")
+    if release is None or not release.text:
+        # Fall back to <latest> if <release> is not available
+        latest = versioning.find("latest")
+        if latest is None or not latest.text:
+            raise Exception(f"No release or latest version found for package '{package_name}'")
+        version = latest.text
+    else:
+        version = release.text
+
+    return PackageVersionResult(
+        ecosystem=Ecosystem.MavenGradle,
+        package_name=package_name,
+        latest_version=version,
+        digest=None,  # Not reliably available from maven-metadata.xml
+        published_on=None,  # Not reliably available from maven-metadata.xml
+    )
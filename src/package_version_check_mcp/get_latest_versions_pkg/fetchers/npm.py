@@ -1,13 +1,27 @@
 """NPM package version fetcher."""
 
-import httpx
+from urllib.parse import quote
+
+import orjson
 
 from ..structs import PackageVersionResult, Ecosystem
+from ..utils.conditional_get import ConditionalGetCache
+from ..utils.http_client import get_http_client
+
+NPM_REGISTRY_URL = "https://registry.npmjs.org/"
+
+_conditional_get_cache: ConditionalGetCache[PackageVersionResult] = ConditionalGetCache()
 
 
 async def fetch_npm_version(package_name: str) -> PackageVersionResult:
     """Fetch the latest version of an NPM package.
 
+    The registry document of popular packages is several megabytes large, because it contains the
+    manifest of every version ever published. The "time" object we need comes after the "versions"
+    object, so the whole document has to be downloaded anyway, and it is decoded with orjson, which is
+    much faster than stream-parsing it event by event in Python. Unchanged documents are revalidated
+    with a conditional GET instead of being downloaded again.
+
     Args:
         package_name: The name of the NPM package
 
@@ -17,25 +31,31 @@ async def fetch_npm_version(package_name: str) -> PackageVersionResult:
     Raises:
         Exception: If the package cannot be found or fetched
     """
-    url = f"https://registry.npmjs.org/{package_name}"
-
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.get(url)
-        response.raise_for_status()
-        data = response.json()
-
-        # Get the latest version from dist-tags
-        version = data.get("dist-tags", {}).get("latest", "ERROR")
-
-        # Get the publication time for this version
-        published_on = None
-        if "time" in data and version in data["time"]:
-            published_on = data["time"][version]
-
-        return PackageVersionResult(
-            ecosystem=Ecosystem.NPM,
-            package_name=package_name,
-            latest_version=version,
-            digest=None,  # NPM doesn't provide digest in the same way
-            published_on=published_on,
-        )
+    # Scoped package names (e.g. "@types/node") keep their "@" and "/", anything else is percent-encoded
+    url = NPM_REGISTRY_URL + quote(package_name, safe="@/")
+
+    revalidation = _conditional_get_cache.lookup(url)
+
+    client = get_http_client()
+    response = await client.get(url, headers=revalidation.headers if revalidation is not None else None)
+    if response.status_code == 304 and revalidation is not None:
+        return revalidation.value
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+
+    # Get the latest version from dist-tags
+    version = data.get("dist-tags", {}).get("latest")
+
+    # Get the publication time for this version
+    published_on = data.get("time", {}).get(version) if version is not None else None
+
+    result = PackageVersionResult(
+        ecosystem=Ecosystem.NPM,
+        package_name=package_name,
+        latest_version=version or "ERROR",
+        digest=None,  # NPM doesn't provide digest in the same way
+        published_on=published_on,
+    )
+    if version is not None:
+        _conditional_get_cache.store(url, response, result)
+    return result
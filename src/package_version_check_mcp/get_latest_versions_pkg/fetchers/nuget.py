@@ -1,8 +1,9 @@
 """NuGet package version fetcher."""
 
-import httpx
+import orjson
 
 from ..structs import PackageVersionResult, Ecosystem
+from ..utils.http_client import get_http_client
 
 
 async def fetch_nuget_version(package_name: str) -> PackageVersionResult:
@@ -21,38 +22,38 @@ async def fetch_nuget_version(package_name: str) -> PackageVersionResult:
     registrations_url = "https://api.nuget.org/v3/registration5-semver1/"
     package_url = f"{registrations_url}{package_name.lower()}/index.json"
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.get(package_url)
-        response.raise_for_status()
-        package_data = response.json()
-
-        # Extract all versions
-        all_versions = []
-        items = package_data.get("items", [])
-        for page in items:
-            page_items = page.get("items", [])
-            for item in page_items:
-                catalog_entry = item.get("catalogEntry", {})
-                version = catalog_entry.get("version")
-                published = catalog_entry.get("published")
-
-                # Filter out prerelease versions (they contain a hyphen)
-                if version and "-" not in version:
-                    all_versions.append({
-                        "version": version,
-                        "published": published
-                    })
-
-        if not all_versions:
-            raise Exception(f"No stable versions found for package '{package_name}'")
-
-        # Get the latest stable version (last in the list)
-        latest = all_versions[-1]
-
-        return PackageVersionResult(
-            ecosystem=Ecosystem.NuGet,
-            package_name=package_name,
-            latest_version=latest["version"],
-            digest=None,  # NuGet doesn't provide digest in the registration API
-            published_on=latest["published"] if latest["published"] != "1900-01-01T00:00:00+00:00" else None,
-        )
+    client = get_http_client()
+    response = await client.get(package_url)
+    response.raise_for_status()
+    package_data = orjson.loads(response.content)
+
+    # Extract all versions
+    all_versions = []
+    items = package_data.get("items", [])
+    for page in items:
+        page_items = page.get("items", [])
+        for item in page_items:
+            catalog_entry = item.get("catalogEntry", {})
+            version = catalog_entry.get("version")
+            published = catalog_entry.get("published")
+
+            # Filter out prerelease versions (they contain a hyphen)
+            if version and "-" not in version:
+                all_versions.append({
+                    "version": version,
+                    "published": published
+                })
+
+    if not all_versions:
+        raise Exception(f"No stable versions found for package '{package_name}'")
+
+    # Get the latest stable version (last in the list)
+    latest = all_versions[-1]
+
+    return PackageVersionResult(
+        ecosystem=Ecosystem.NuGet,
+        package_name=package_name,
+        latest_version=latest["version"],
+        digest=None,  # NuGet doesn't provide digest in the registration API
+        published_on=latest["published"] if latest["published"] != "1900-01-01T00:00:00+00:00" else None,
+    )
@@ -3,10 +3,16 @@
 import re
 from typing import Optional
 
-import httpx
+import orjson
 
 from ..structs import PackageVersionResult, Ecosystem
 from ..utils.version_parser import parse_semver, compare_semver
+from ..utils.http_client import get_http_client
+
+# Precompiled patterns for parsing version hints and the PHP constraints of each package version
+_PHP_VERSION_HINT_RE = re.compile(r"^\d+\.\d+")
+_CONSTRAINT_RE = re.compile(r"^([<>=^~!]*)(.+)$")
+_VERSION_SUFFIX_SEPARATOR_RE = re.compile(r"[-@]")
 
 
 def parse_php_version_hint(version_hint: Optional[str]) -> Optional[str]:
@@ -26,7 +32,7 @@ def parse_php_version_hint(version_hint: Optional[str]) -> Optional[str]:
         return version_hint[4:].strip()
 
     # Handle plain version like '8.1'
-    if re.match(r"^\d+\.\d+", version_hint):
+    if _PHP_VERSION_HINT_RE.match(version_hint):
         return version_hint.strip()
 
     return None
@@ -61,7 +67,7 @@ def check_php_constraint(php_constraint: str, target_php_version: str) -> bool:
         return all(check_php_constraint(part, target_php_version) for part in parts)
 
     # Extract operator and version
-    match = re.match(r"^([<>=^~!]*)(.+)$", constraint)
+    match = _CONSTRAINT_RE.match(constraint)
     if not match:
         return True  # Can't parse, assume compatible
 
@@ -70,7 +76,7 @@ def check_php_constraint(php_constraint: str, target_php_version: str) -> bool:
 
     # Handle special version formats like '>=8.1.0-beta'
     # Extract just the numeric part before any prerelease suffix
-    version_str = re.split(r"[-@]", version_str)[0]
+    version_str = _VERSION_SUFFIX_SEPARATOR_RE.split(version_str, maxsplit=1)[0]
 
     # Use compare_semver for version comparison
     cmp = compare_semver(target_php_version, version_str)
@@ -124,70 +130,65 @@ async def fetch_php_version(
     url = f"https://repo.packagist.org/p2/{package_name}.json"
     target_php_version = parse_php_version_hint(version_hint)
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.get(
-            url,
-            headers={
-                "User-Agent": "package-version-check-mcp/1.0"
-            },
-        )
-        response.raise_for_status()
-        data = response.json()
+    client = get_http_client()
+    response = await client.get(url)
+    response.raise_for_status()
+    data = orjson.loads(response.content)
 
-        packages = data.get("packages", {})
-        versions_list = packages.get(package_name, [])
+    packages = data.get("packages", {})
+    versions_list = packages.get(package_name, [])
 
-        if not versions_list:
-            raise ValueError(f"No versions found for package '{package_name}'")
+    if not versions_list:
+        raise ValueError(f"No versions found for package '{package_name}'")
 
-        # The v2 API returns versions in a minified format.
-        # The first entry has full data, subsequent entries only have changed fields.
-        # We need to "expand" the data by carrying forward unchanged fields.
-        # For our purposes, we mainly care about version, time, and require.php
+    # The v2 API returns versions in a minified format.
+    # The first entry has full data, subsequent entries only have changed fields.
+    # We need to "expand" the data by carrying forward unchanged fields.
+    # For our purposes, we mainly care about version, time, and require.php
 
-        latest_version = None
-        latest_time = None
+    latest_version = None
+    latest_time = None
 
-        # Track the "current" full record as we iterate
-        current_record = {}
+    # Track the "current" full record as we iterate
+    current_record = {}
 
-        for version_data in versions_list:
-            # Merge with current record (version_data overrides)
-            current_record = {**current_record, **version_data}
+    for version_data in versions_list:
+        # Merge with current record (version_data overrides)
+        current_record = {**current_record, **version_data}
 
-            version = current_record.get("version", "")
+        version = current_record.get("version", "")
 
-            # Skip non-stable versions (those with prerelease suffix)
-            _, prerelease = parse_semver(version)
-            if prerelease:
+        # Skip non-stable versions (those with prerelease suffix)
+        _, prerelease = parse_semver(version)
+        if prerelease:
+            continue
+
+        # Check PHP version compatibility if a hint was provided
+        if target_php_version:
+            require = current_record.get("require", {})
+            php_constraint = require.get("php", "")
+            if php_constraint and not check_php_constraint(
+                php_constraint, target_php_version
+            ):
                 continue
 
-            # Check PHP version compatibility if a hint was provided
-            if target_php_version:
-                require = current_record.get("require", {})
-                php_constraint = require.get("php", "")
-                if php_constraint and not check_php_constraint(
-                    php_constraint, target_php_version
-                ):
-                    continue
-
-            # Take the first stable version that matches (they're ordered newest first)
-            latest_version = version
-            latest_time = current_record.get("time")
-            break
-
-        if not latest_version:
-            if target_php_version:
-                raise ValueError(
-                    f"No stable version found for package '{package_name}' "
-                    f"compatible with PHP {target_php_version}"
-                )
-            raise ValueError(f"No stable version found for package '{package_name}'")
-
-        return PackageVersionResult(
-            ecosystem=Ecosystem.PHP,
-            package_name=package_name,
-            latest_version=latest_version,
-            digest=None,  # Not returning digest as per requirements
-            published_on=latest_time,
-        )
+        # Take the first stable version that matches (they're ordered newest first)
+        latest_version = version
+        latest_time = current_record.get("time")
+        break
+
+    if not latest_version:
+        if target_php_version:
+            raise ValueError(
+                f"No stable version found for package '{package_name}' "
+                f"compatible with PHP {target_php_version}"
+            )
+        raise ValueError(f"No stable version found for package '{package_name}'")
+
+    return PackageVersionResult(
+        ecosystem=Ecosystem.PHP,
+        package_name=package_name,
+        latest_version=latest_version,
+        digest=None,  # Not returning digest as per requirements
+        published_on=latest_time,
+    )
@@ -1,13 +1,165 @@
 """PyPI package version fetcher."""
 
-import httpx
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Optional
+from urllib.parse import quote
+
+import ijson
+import orjson
+from packaging.utils import canonicalize_name
+from packaging.version import Version, InvalidVersion
 
 from ..structs import PackageVersionResult, Ecosystem
+from ..utils.conditional_get import ConditionalGetCache
+from ..utils.http_client import get_http_client
+from ..utils.json_stream import AsyncByteReader
+
+SIMPLE_API_JSON_CONTENT_TYPE = "application/vnd.pypi.simple.v1+json"
+
+_conditional_get_cache: ConditionalGetCache[PackageVersionResult] = ConditionalGetCache()
+
+
+@lru_cache(maxsize=16384)
+def _parse_version(version_str: str) -> Optional[Version]:
+    """Parse a version string, caching the result (common version strings repeat across packages and lookups).
+
+    Args:
+        version_str: The version string, e.g. "2.32.3"
+
+    Returns:
+        The parsed version, or None if the version string is invalid
+    """
+    try:
+        return Version(version_str)
+    except InvalidVersion:
+        return None
+
+
+def parse_distribution_version(filename: str) -> Optional[Version]:
+    """Extract the version from a wheel or sdist filename.
+
+    Args:
+        filename: A distribution filename, e.g. "requests-2.32.3-py3-none-any.whl"
+
+    Returns:
+        The parsed version, or None for filenames that are neither a valid wheel nor sdist
+        (e.g. legacy .egg or .exe files)
+    """
+    # Only the version component is needed, so instead of packaging's parse_wheel_filename() /
+    # parse_sdist_filename() (which also validate the name and parse the wheel tags, for every
+    # file) split it off the same way they do and parse it with the cached _parse_version()
+    if filename.endswith(".whl"):
+        parts = filename[: -len(".whl")].split("-")
+        if len(parts) not in (5, 6) or not parts[0]:
+            return None
+        return _parse_version(parts[1])
+    if filename.endswith(".tar.gz"):
+        stem = filename[: -len(".tar.gz")]
+    elif filename.endswith(".zip"):
+        stem = filename[: -len(".zip")]
+    else:
+        return None
+    # PEP 440 versions cannot contain dashes, so the version follows the last dash
+    name, sep, version_str = stem.rpartition("-")
+    if not sep or not name:
+        return None
+    return _parse_version(version_str)
+
+
+def _upload_time_sort_key(file: dict) -> tuple[bool, datetime]:
+    """Sort key that orders Simple API file entries by their upload time, those without one last."""
+    upload_time = file.get("upload-time")
+    if not upload_time:
+        return True, datetime.max.replace(tzinfo=timezone.utc)
+    return False, datetime.fromisoformat(upload_time)
 
 
 async def fetch_pypi_version(package_name: str) -> PackageVersionResult:
     """Fetch the latest version of a PyPI package.
 
+    Uses the JSON variant of the Simple Repository API (PEP 691 / PEP 700), which only lists the
+    versions and files, and is therefore much smaller than the full /pypi/<package>/json document.
+
+    Args:
+        package_name: The name of the PyPI package
+
+    Returns:
+        PackageVersionResult with the latest version information
+
+    Raises:
+        Exception: If the package cannot be found or fetched
+    """
+    # The Simple API redirects non-normalized names, so we request the normalized (PEP 503) name directly
+    url = f"https://pypi.org/simple/{canonicalize_name(package_name)}/"
+
+    headers = {"Accept": SIMPLE_API_JSON_CONTENT_TYPE}
+    revalidation = _conditional_get_cache.lookup(url)
+    if revalidation is not None:
+        headers.update(revalidation.headers)
+
+    client = get_http_client()
+    response = await client.get(url, headers=headers)
+    if response.status_code == 304 and revalidation is not None:
+        # Different spellings of the package name share the same (normalized) URL
+        return revalidation.value.model_copy(update={"package_name": package_name})
+    response.raise_for_status()
+
+    # Some mirrors/proxies only serve the HTML variant of the Simple API
+    if not response.headers.get("content-type", "").startswith(SIMPLE_API_JSON_CONTENT_TYPE):
+        return await _fetch_pypi_version_from_json_api(package_name)
+
+    data = orjson.loads(response.content)
+
+    # Group the (non-yanked) files by version
+    files_by_version: dict[Version, list[dict]] = {}
+    for file in data.get("files", []):
+        if file.get("yanked"):
+            continue
+        version = parse_distribution_version(file.get("filename", ""))
+        if version is not None:
+            files_by_version.setdefault(version, []).append(file)
+
+    # Like PyPI's own "latest version", prefer the highest stable version
+    candidates = []
+    for version_str in data.get("versions", []):
+        version = _parse_version(version_str)
+        if version is not None and version in files_by_version:
+            candidates.append((version, version_str))
+
+    if not candidates:
+        raise Exception(f"No released versions found for package '{package_name}'")
+
+    stable_candidates = [c for c in candidates if not c[0].is_prerelease]
+    latest, version_str = max(stable_candidates or candidates, key=lambda c: c[0])
+
+    # PyPI provides digests and upload times for individual files, not the release as a whole,
+    # so we use those of the first uploaded file. The Simple API does not list files in upload order.
+    first_file = min(files_by_version[latest], key=_upload_time_sort_key)
+    published_on = first_file.get("upload-time")
+
+    digest = None
+    sha256 = first_file.get("hashes", {}).get("sha256")
+    if sha256:
+        digest = f"sha256:{sha256}"
+
+    result = PackageVersionResult(
+        ecosystem=Ecosystem.PyPI,
+        package_name=package_name,
+        latest_version=version_str,
+        digest=digest,
+        published_on=published_on,
+    )
+    _conditional_get_cache.store(url, response, result)
+    return result
+
+
+async def _fetch_pypi_version_from_json_api(package_name: str) -> PackageVersionResult:
+    """Fetch the latest version of a PyPI package from the (larger) /pypi/<package>/json endpoint.
+
+    The document contains every file of every release, so it is stream-parsed: "info" comes first, and the
+    download is aborted once the first file of the latest release has been read.
+
     Args:
         package_name: The name of the PyPI package
 
@@ -17,38 +169,42 @@ async def fetch_pypi_version(package_name: str) -> PackageVersionResult:
     Raises:
         Exception: If the package cannot be found or fetched
     """
-    url = f"https://pypi.org/pypi/{package_name}/json"
+    url = f"https://pypi.org/pypi/{quote(package_name, safe='')}/json"
+
+    revalidation = _conditional_get_cache.lookup(url)
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.get(url)
+    version = None
+    published_on = None
+    digest = None
+
+    client = get_http_client()
+    async with client.stream("GET", url, headers=revalidation.headers if revalidation is not None else None) as response:
+        if response.status_code == 304 and revalidation is not None:
+            return revalidation.value
         response.raise_for_status()
-        data = response.json()
-
-        info = data.get("info", {})
-        version = info.get("version", "ERROR")
-
-        # Get the upload time for the latest version
-        published_on = None
-        releases = data.get("releases", {})
-        if version in releases and releases[version]:
-            # Get the first release file's upload time
-            upload_time = releases[version][0].get("upload_time_iso_8601")
-            if upload_time:
-                published_on = upload_time
-
-        # PyPI provides digests for individual files, not the package as a whole
-        # We could return the digest of the first wheel/source dist if needed
-        digest = None
-        if version in releases and releases[version]:
-            # Get the sha256 digest of the first file
-            first_file = releases[version][0]
-            if "digests" in first_file and "sha256" in first_file["digests"]:
-                digest = f"sha256:{first_file['digests']['sha256']}"
-
-        return PackageVersionResult(
-            ecosystem=Ecosystem.PyPI,
-            package_name=package_name,
-            latest_version=version,
-            digest=digest,
-            published_on=published_on,
-        )
+
+        # Get the upload time and sha256 digest of the latest version's first file
+        first_file_prefix = None
+        reader = AsyncByteReader(response.aiter_bytes())
+        async for prefix, event, value in ijson.parse_async(reader):
+            if prefix == "info.version" and event == "string":
+                version = value
+                first_file_prefix = f"releases.{version}.item"
+            elif first_file_prefix is None or not prefix.startswith(first_file_prefix):
+                continue
+            elif prefix == f"{first_file_prefix}.upload_time_iso_8601":
+                published_on = value
+            elif prefix == f"{first_file_prefix}.digests.sha256":
+                digest = f"sha256:{value}"
+            elif prefix == first_file_prefix and event == "end_map":
+                break
+
+    result = PackageVersionResult(
+        ecosystem=Ecosystem.PyPI,
+        package_name=package_name,
+        latest_version=version or "ERROR",
+        digest=digest,
+        published_on=published_on,
+    )
+    _conditional_get_cache.store(url, response, result)
+    return result
@@ -1,11 +1,13 @@
 """Terraform provider and module version fetchers."""
 
 from typing import Callable
-import httpx
 import functools
 
+import orjson
+
 from ..structs import PackageVersionResult, Ecosystem
 from ..utils.version_parser import compare_semver
+from ..utils.http_client import get_http_client
 
 
 def parse_terraform_provider_name(package_name: str) -> tuple[str, str, str]:
@@ -112,40 +114,40 @@ async def _fetch_terraform_registry_version(
     Raises:
         Exception: If the package cannot be found or fetched
     """
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.get(url)
-        response.raise_for_status()
-        data = response.json()
-
-        versions_list = extract_versions(data)
-        if not versions_list:
-            raise Exception(f"No versions found for '{package_name}'")
-
-        # Filter out prerelease versions and find the latest stable version
-        stable_versions = []
-        for v in versions_list:
-            version_str = v.get("version", "")
-            if version_str and "-" not in version_str:
-                stable_versions.append(version_str)
-
-        if not stable_versions:
-            # Fall back to all versions if no stable versions found
-            stable_versions = [v.get("version", "") for v in versions_list if v.get("version")]
-
-        if not stable_versions:
-            raise Exception(f"No valid versions found for '{package_name}'")
-
-        # Sort versions and get the latest
-        stable_versions.sort(key=functools.cmp_to_key(compare_semver), reverse=True)
-        latest_version = stable_versions[0]
-
-        return PackageVersionResult(
-            ecosystem=ecosystem,
-            package_name=package_name,
-            latest_version=latest_version,
-            digest=None,  # Terraform registry doesn't provide a single digest at version level
-            published_on=None,  # Not readily available from the versions endpoint
-        )
+    client = get_http_client()
+    response = await client.get(url)
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+
+    versions_list = extract_versions(data)
+    if not versions_list:
+        raise Exception(f"No versions found for '{package_name}'")
+
+    # Filter out prerelease versions and find the latest stable version
+    stable_versions = []
+    for v in versions_list:
+        version_str = v.get("version", "")
+        if version_str and "-" not in version_str:
+            stable_versions.append(version_str)
+
+    if not stable_versions:
+        # Fall back to all versions if no stable versions found
+        stable_versions = [v.get("version", "") for v in versions_list if v.get("version")]
+
+    if not stable_versions:
+        raise Exception(f"No valid versions found for '{package_name}'")
+
+    # Sort versions and get the latest
+    stable_versions.sort(key=functools.cmp_to_key(compare_semver), reverse=True)
+    latest_version = stable_versions[0]
+
+    return PackageVersionResult(
+        ecosystem=ecosystem,
+        package_name=package_name,
+        latest_version=latest_version,
+        digest=None,  # Terraform registry doesn't provide a single digest at version level
+        published_on=None,  # Not readily available from the versions endpoint
+    )
 
 
 async def fetch_terraform_provider_version(package_name: str) -> PackageVersionResult:
@@ -1,7 +1,7 @@
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class Ecosystem(str, Enum):
@@ -30,6 +30,9 @@ class PackageVersionRequest(BaseModel):
 class PackageVersionResult(BaseModel):
     """Successful package version lookup result."""
 
+    # Results are cached and shared between callers, so they must not be modified
+    model_config = ConfigDict(frozen=True)
+
     ecosystem: Ecosystem
     package_name: str
     latest_version: str
@@ -40,6 +43,9 @@ class PackageVersionResult(BaseModel):
 class PackageVersionError(BaseModel):
     """Error during package version lookup."""
 
+    # Shared by all concurrent callers of the same lookup
+    model_config = ConfigDict(frozen=True)
+
     ecosystem: Ecosystem
     package_name: str
     error: str
@@ -1,5 +1,10 @@
 """Utility modules for version parsing and comparison."""
 
-from .version_parser import parse_semver, compare_semver, parse_docker_tag
+from .version_parser import parse_semver, compare_semver, parse_docker_tag, ParsedDockerTag
+from .http_client import get_http_client, aclose_http_client
+from .ttl_cache import TTLCache
+from .conditional_get import ConditionalGetCache, Revalidation
+from .semaphores import get_semaphore
+from .json_stream import AsyncByteReader
 
-__all__ = ["parse_semver", "compare_semver", "parse_docker_tag"]
+__all__ = ["parse_semver", "compare_semver", "parse_docker_tag", "ParsedDockerTag", "get_http_client", "aclose_http_client", "TTLCache", "ConditionalGetCache", "Revalidation", "get_semaphore", "AsyncByteReader"]
@@ -0,0 +1,66 @@
+"""Cache for revalidating responses with conditional GET requests (ETag / Last-Modified)."""
+
+from typing import Generic, NamedTuple, Optional, TypeVar
+
+import httpx
+
+V = TypeVar("V")
+
+
+class Revalidation(NamedTuple, Generic[V]):
+    """The request headers to revalidate a cached response with, and the value derived from that response."""
+
+    headers: dict[str, str]  # If-None-Match / If-Modified-Since
+    value: V
+
+
+class ConditionalGetCache(Generic[V]):
+    """Remembers the validators (ETag, Last-Modified) of responses, together with the value derived from them.
+
+    When the value of a URL is needed again (e.g. because the TTL of the dispatcher's cache expired), the
+    request is sent with If-None-Match / If-Modified-Since headers. If the registry answers with
+    304 Not Modified, the remembered value is reused, without downloading or parsing the response body.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self._entries: dict[str, Revalidation[V]] = {}
+        self._max_entries = max_entries
+
+    def lookup(self, url: str) -> Optional[Revalidation[V]]:
+        """Look up the revalidation headers and value for a URL.
+
+        Args:
+            url: The requested URL
+
+        Returns:
+            The Revalidation, or None if no validators are known for the URL
+        """
+        return self._entries.get(url)
+
+    def store(self, url: str, response: httpx.Response, value: V) -> None:
+        """Remember the validators of a (successful) response and the value derived from it.
+
+        Responses without ETag and Last-Modified headers are not remembered.
+
+        Args:
+            url: The requested URL
+            response: The response whose headers contain the validators
+            value: The value derived from the response
+        """
+        headers = {}
+        if etag := response.headers.get("etag"):
+            headers["If-None-Match"] = etag
+        if last_modified := response.headers.get("last-modified"):
+            headers["If-Modified-Since"] = last_modified
+        if not headers:
+            return
+
+        # Re-insert the URL, so that the least recently stored entry is evicted first
+        self._entries.pop(url, None)
+        if len(self._entries) >= self._max_entries:
+            del self._entries[next(iter(self._entries))]
+        self._entries[url] = Revalidation(headers, value)
+
+    def clear(self) -> None:
+        """Remove all remembered validators."""
+        self._entries.clear()
@@ -0,0 +1,116 @@
+"""Shared, pooled HTTP client for the package version fetchers."""
+
+import asyncio
+import random
+from typing import Any, Callable, Coroutine, Optional
+
+import httpx
+
+# A stable User-Agent identifies this server to the registries (Packagist, for instance, asks for one)
+USER_AGENT = "package-version-check-mcp/1.0"
+
+# Fail fast on connect/pool problems (a flaky registry must not block a concurrency slot for long), but give
+# slow registries enough time to send their (possibly large) documents
+HTTP_TIMEOUT = httpx.Timeout(connect=2.0, read=8.0, write=2.0, pool=1.0)
+
+# Transient failures are retried a few times, with exponential backoff and jitter
+MAX_ATTEMPTS = 3
+RETRY_STATUS_CODES = frozenset({502, 503, 504})
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+class RetryingTransport(httpx.AsyncBaseTransport):
+    """Transport that retries requests which failed with a connect error or a 502/503/504 response.
+
+    Retrying at the transport level covers every request of the shared client, including streamed ones,
+    because the retried response is only handed to the caller once its status is known.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_attempts: int = MAX_ATTEMPTS):
+        self._transport = transport
+        self._max_attempts = max_attempts
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(self._max_attempts - 1):
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.ConnectError:
+                pass
+            else:
+                if response.status_code not in RETRY_STATUS_CODES:
+                    return response
+                await response.aclose()
+
+            await asyncio.sleep(0.1 * 2 ** attempt + random.random() * 0.1)
+
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def close_on_previous_loop(
+    close: Callable[[], Coroutine[Any, Any, None]], loop: Optional[asyncio.AbstractEventLoop]
+) -> None:
+    """Close a shared client that is replaced because it belongs to another event loop than the running one.
+
+    The connections of a client can only be closed on the loop they were opened on. If that loop is still
+    running (in another thread), the client is closed there. Otherwise, the loop has typically been closed
+    already (e.g. by asyncio.run() or at the end of a test), so it can never run the close coroutine, and the
+    client is dropped without closing it. Its sockets are released once it is garbage collected.
+
+    Args:
+        close: The close coroutine function of the client, e.g. client.aclose
+        loop: The event loop the client belongs to
+    """
+    if loop is not None and loop.is_running():
+        asyncio.run_coroutine_threadsafe(close(), loop)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared httpx.AsyncClient, creating it on first use.
+
+    Reusing one client keeps connections to the registries alive between lookups, which avoids
+    a TCP + TLS handshake per request. The client is bound to the event loop it was created on,
+    so a new one is created if it is requested from a different loop (e.g. a new test's loop), and
+    the previous one is closed (see close_on_previous_loop()).
+    No lock is needed: the check-and-create below contains no await, so it cannot interleave.
+
+    Returns:
+        The shared httpx.AsyncClient
+    """
+    global _client, _client_loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        if _client is not None and not _client.is_closed:
+            close_on_previous_loop(_client.aclose, _client_loop)
+
+        # HTTP/2 and the connection limits are transport settings, because a custom transport is used
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30.0),
+        )
+        _client = httpx.AsyncClient(
+            timeout=HTTP_TIMEOUT,
+            # httpx offers brotli (and gzip) compression automatically, because the brotli package is installed
+            headers={"User-Agent": USER_AGENT},
+            transport=RetryingTransport(transport),
+        )
+        _client_loop = loop
+
+    return _client
+
+
+async def aclose_http_client() -> None:
+    """Close the shared httpx.AsyncClient (if any), e.g. when the MCP server shuts down."""
+    global _client, _client_loop
+
+    client = _client
+    _client = None
+    _client_loop = None
+
+    if client is not None and not client.is_closed:
+        await client.aclose()
@@ -0,0 +1,18 @@
+"""Helpers for stream-parsing large JSON responses with ijson."""
+
+from typing import AsyncIterator
+
+
+class AsyncByteReader:
+    """Adapts an async iterator of byte chunks to the async file-like interface expected by ijson."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:  # ijson probes the return type with an empty read
+            return b""
+        try:
+            return await anext(self._chunks)
+        except StopAsyncIteration:
+            return b""
@@ -0,0 +1,34 @@
+"""Process-wide semaphores that limit the number of concurrent requests per registry."""
+
+import asyncio
+from typing import Hashable, Optional
+
+_semaphores: dict[Hashable, asyncio.Semaphore] = {}
+_semaphores_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_semaphore(name: Hashable, limit: int) -> asyncio.Semaphore:
+    """Return the shared semaphore for a registry (or other resource), creating it on first use.
+
+    Unlike a per-call semaphore, the shared semaphore also limits the requests of concurrent tool calls,
+    which keeps large workloads below the rate limits of the registries. Like the shared HTTP client, the
+    semaphores are bound to the event loop they were created on, so they are recreated for a new loop.
+
+    Args:
+        name: The name of the semaphore, e.g. the ecosystem
+        limit: The maximum number of concurrent holders, used when the semaphore is created
+
+    Returns:
+        The shared asyncio.Semaphore
+    """
+    global _semaphores_loop
+
+    loop = asyncio.get_running_loop()
+    if _semaphores_loop is not loop:
+        _semaphores.clear()
+        _semaphores_loop = loop
+
+    semaphore = _semaphores.get(name)
+    if semaphore is None:
+        semaphore = _semaphores[name] = asyncio.Semaphore(limit)
+    return semaphore
@@ -0,0 +1,48 @@
+"""In-process TTL cache for (async) version lookups."""
+
+import time
+from typing import Generic, Hashable, Optional, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """A small in-process cache whose entries expire after a caller-provided time-to-live.
+
+    The time-to-live is passed to get(), so expired entries stay in the cache until their key is set again
+    or they are evicted. Once max_entries is reached, the least recently used entry is evicted, which bounds
+    the memory of long-running servers that look up many distinct packages.
+    """
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        self._entries: dict[Hashable, tuple[float, V]] = {}
+        self._max_entries = max_entries
+
+    def get(self, key: Hashable, ttl: float) -> tuple[Optional[V], bool]:
+        """Look up a cached value.
+
+        Args:
+            key: The cache key
+            ttl: The time-to-live (in seconds) the entry is considered fresh for
+
+        Returns:
+            A tuple of (value, is_fresh). The value is None if the key was never cached.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None, False
+        # Re-insert the entry, so that the least recently used entry is evicted first
+        self._entries[key] = entry
+        stored_at, value = entry
+        return value, time.monotonic() - stored_at < ttl
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Store a value, marking it as fresh from now on."""
+        self._entries.pop(key, None)
+        if len(self._entries) >= self._max_entries:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic(), value)
+
+    def clear(self) -> None:
+        """Remove all cached values."""
+        self._entries.clear()
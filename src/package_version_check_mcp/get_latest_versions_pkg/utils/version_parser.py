@@ -1,9 +1,31 @@
 """Utilities for parsing and comparing semantic versions."""
 
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import NamedTuple, Optional
 from packaging.version import Version, InvalidVersion
 
+# Precompiled patterns and constants for parse_docker_tag(), which runs once per available tag
+_SPECIAL_DOCKER_TAGS = frozenset({'latest', 'stable', 'edge', 'nightly', 'dev', 'master', 'main'})
+# Special tags and commit hashes (7-40 hex characters), rejected with a single match
+_REJECTED_TAG_RE = re.compile(
+    r'(?:' + '|'.join(sorted(_SPECIAL_DOCKER_TAGS)) + r'|[a-f0-9]{7,40})', re.IGNORECASE
+)
+_LEADING_V_RE = re.compile(r'^v')
+_DOCKER_VERSION_RE = re.compile(r'^(?P<version>\d+(?:\.\d+)*)(?P<prerelease>\w*)$')
+
+# Number of parts the release tuple of a ParsedDockerTag is padded to
+RELEASE_LENGTH = 10
+
+
+class ParsedDockerTag(NamedTuple):
+    """The components of a Docker tag, as returned by parse_docker_tag()."""
+
+    release: tuple[int, ...]  # Integer version parts, zero-padded to RELEASE_LENGTH parts for cheap comparison
+    suffix: str  # e.g. 'alpine', 'slim'
+    prerelease: str  # Prerelease identifier
+    original: str  # The original tag
+
 
 def parse_semver(version: str) -> tuple[list[int], str]:
     """Parse a semantic version into numeric parts and prerelease suffix.
@@ -58,32 +80,37 @@ def compare_semver(version1: str, version2: str) -> int:
         return 0
 
 
-def parse_docker_tag(tag: str) -> Optional[dict]:
+@lru_cache(maxsize=8192)
+def parse_docker_tag(tag: str) -> Optional[ParsedDockerTag]:
     """Parse a Docker tag into its components.
 
+    The results are cached, because the same tags (and tag hints) are parsed again on every lookup of an
+    image. The cache is large enough to hold all tags of images with thousands of tags.
+
     Args:
         tag: The Docker tag to parse
 
     Returns:
-        A dictionary with parsed components, or None if the tag is invalid:
-        - release: List of integer version parts
-        - suffix: String suffix (e.g., 'alpine', 'slim')
-        - prerelease: Prerelease identifier
-        - original: The original tag
+        A ParsedDockerTag with the parsed components, or None if the tag is invalid
     """
     if not tag:
         return None
 
-    # Ignore special tags like 'latest', 'stable', 'edge', etc.
-    if tag.lower() in ('latest', 'stable', 'edge', 'nightly', 'dev', 'master', 'main'):
-        return None
-
-    # Ignore commit hashes (7-40 hex characters, but not purely numeric)
-    if re.match(r'^[a-f0-9]{7,40}$', tag, re.IGNORECASE) and not re.match(r'^[0-9]+$', tag):
+    # Fast path for plain version tags like '1.2.3' (the majority of tags), which need none of the checks below
+    parts = tag.split('.')
+    if all(part.isdecimal() for part in parts):
+        if len(parts) == 1 and int(tag) >= 1000:
+            return None
+        release = tuple(int(x) for x in parts) + (0,) * (RELEASE_LENGTH - len(parts))
+        return ParsedDockerTag(release=release, suffix='', prerelease='', original=tag)
+
+    # Ignore special tags like 'latest', 'stable', 'edge', etc., and commit hashes. Purely numeric tags, which
+    # would look like commit hashes, were already handled by the fast path
+    if _REJECTED_TAG_RE.fullmatch(tag):
         return None
 
     # Remove leading 'v'
-    clean_tag = re.sub(r'^v', '', tag)
+    clean_tag = _LEADING_V_RE.sub('', tag)
 
     # Split on first '-' to separate version from suffix
     parts = clean_tag.split('-', 1)
@@ -91,7 +118,7 @@ def parse_docker_tag(tag: str) -> Optional[dict]:
     suffix = parts[1] if len(parts) > 1 else ''
 
     # Match version pattern: numeric parts with optional prerelease
-    match = re.match(r'^(?P<version>\d+(?:\.\d+)*)(?P<prerelease>\w*)$', prefix)
+    match = _DOCKER_VERSION_RE.match(prefix)
     if not match:
         return None
 
@@ -107,12 +134,8 @@ def parse_docker_tag(tag: str) -> Optional[dict]:
         except ValueError:
             pass
 
-    # Split version into numeric parts
-    release = [int(x) for x in version_str.split('.')]
+    # Split version into numeric parts, padded so that e.g. '1.2' and '1.2.0' compare as equal
+    parts = version_str.split('.')
+    release = tuple(int(x) for x in parts) + (0,) * (RELEASE_LENGTH - len(parts))
 
-    return {
-        'release': release,
-        'suffix': suffix,
-        'prerelease': prerelease,
-        'original': tag
-    }
+    return ParsedDockerTag(release=release, suffix=suffix, prerelease=prerelease, original=tag)
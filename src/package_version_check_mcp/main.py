@@ -7,22 +7,37 @@ import argparse
 import asyncio
 import json
 import subprocess
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 from fastmcp import FastMCP
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
 from package_version_check_mcp.get_github_actions_pkg.functions import fetch_github_action
-from package_version_check_mcp.get_github_actions_pkg.structs import GitHubActionResult, GitHubActionError, \
+from package_version_check_mcp.get_github_actions_pkg.structs import GitHubActionResult, \
     GetGitHubActionVersionsResponse
-from package_version_check_mcp.get_latest_versions_pkg import fetch_package_version
+from package_version_check_mcp.get_latest_versions_pkg import fetch_package_versions
 from package_version_check_mcp.get_latest_versions_pkg.structs import PackageVersionRequest, \
-    PackageVersionResult, PackageVersionError, GetLatestVersionsResponse
+    PackageVersionResult, GetLatestVersionsResponse
+from package_version_check_mcp.get_latest_versions_pkg.fetchers.docker import aclose_registry_client
+from package_version_check_mcp.get_latest_versions_pkg.utils.http_client import aclose_http_client
 from package_version_check_mcp.get_latest_tools_pkg.functions import fetch_latest_tool_version
-from package_version_check_mcp.get_latest_tools_pkg.structs import LatestToolResult, LatestToolError, \
+from package_version_check_mcp.get_latest_tools_pkg.structs import LatestToolResult, \
     GetLatestToolVersionsResponse
 
-mcp = FastMCP("Package Version Check")
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Release pooled HTTP connections when the server shuts down."""
+    try:
+        yield
+    finally:
+        await aclose_http_client()
+        await aclose_registry_client()
+
+
+mcp = FastMCP("Package Version Check", lifespan=lifespan)
 
 
 @mcp.custom_route("/health", methods=["GET"])
@@ -84,11 +99,8 @@ async def get_latest_package_versions(
         ...     PackageVersionRequest(ecosystem=Ecosystem.PHP, package_name="laravel/framework", version_hint="php:8.1"),
         ... ])
     """
-    # Fetch all package versions concurrently
-    results = await asyncio.gather(
-        *[fetch_package_version(req) for req in packages],
-        return_exceptions=False,
-    )
+    # Fetch all package versions concurrently (with bounded concurrency)
+    results = await fetch_package_versions(packages)
 
     # Separate successful results from errors
     successful_results = []
@@ -97,7 +109,7 @@ async def get_latest_package_versions(
     for result in results:
         if isinstance(result, PackageVersionResult):
             successful_results.append(result)
-        elif isinstance(result, PackageVersionError):
+        else:
             errors.append(result)
 
     return GetLatestVersionsResponse(result=successful_results, lookup_errors=errors)
@@ -135,11 +147,14 @@ async def get_github_action_versions_and_args(
         ...     include_readme=True
         ... )
     """
-    # Fetch all action information concurrently
-    results = await asyncio.gather(
-        *[fetch_github_action(name, include_readme) for name in action_names],
+    # Fetch all action information concurrently, looking up duplicate action names only once
+    unique_names = list(dict.fromkeys(action_names))
+    unique_results = await asyncio.gather(
+        *[fetch_github_action(name, include_readme) for name in unique_names],
         return_exceptions=False,
     )
+    result_by_name = dict(zip(unique_names, unique_results))
+    results = [result_by_name[name] for name in action_names]
 
     # Separate successful results from errors
     successful_results = []
@@ -148,7 +163,7 @@ async def get_github_action_versions_and_args(
     for result in results:
         if isinstance(result, GitHubActionResult):
             successful_results.append(result)
-        elif isinstance(result, GitHubActionError):
+        else:
             errors.append(result)
 
     return GetGitHubActionVersionsResponse(result=successful_results, lookup_errors=errors)
@@ -232,7 +247,7 @@ async def get_latest_tool_versions(
     for result in results:
         if isinstance(result, LatestToolResult):
             successful_results.append(result)
-        elif isinstance(result, LatestToolError):
+        else:
             errors.append(result)
 
     return GetLatestToolVersionsResponse(result=successful_results, lookup_errors=errors)
@@ -0,0 +1,227 @@
+"""Shared pytest fixtures."""
+
+import asyncio
+import hashlib
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import AsyncGenerator, Generator
+
+import httpx
+import pytest
+from fastmcp import Client
+
+from package_version_check_mcp.main import mcp
+
+logger = logging.getLogger(__name__)
+
+# The files and directories (relative to the project root) that the Docker image is built from
+BUILD_CONTEXT_PATHS = ["Dockerfile", "pyproject.toml", "poetry.lock", "requirements-poetry.txt", "src"]
+
+# The label of the e2e test containers, whose value is the image tag. It identifies reusable containers.
+CONTAINER_LABEL = "package-version-check-mcp-test"
+
+# How much of the container's stdout/stderr logs is reported if the container does not become healthy
+MAX_CONTAINER_LOG_BYTES = 64 * 1024
+
+
+def compute_build_context_hash(project_root: Path) -> str:
+    """Hash the files that the Docker image is built from.
+
+    Args:
+        project_root: The root directory of the project
+
+    Returns:
+        A short hex digest that changes whenever any file of the build context changes
+    """
+    files = []
+    for relative_path in BUILD_CONTEXT_PATHS:
+        path = project_root / relative_path
+        if path.is_dir():
+            files.extend(p for p in path.rglob("*") if p.is_file() and "__pycache__" not in p.parts)
+        elif path.is_file():
+            files.append(path)
+
+    digest = hashlib.sha256()
+    for path in sorted(files):
+        digest.update(path.relative_to(project_root).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()[:12]
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run the async tests on uvloop, which handles the tests' socket-heavy I/O faster than asyncio's default loop.
+
+    uvloop is not available on Windows, where the default policy is used.
+    """
+    if sys.platform == "win32":
+        return asyncio.DefaultEventLoopPolicy()
+
+    import uvloop
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
+async def mcp_client() -> AsyncGenerator[Client, None]:
+    """Create a FastMCP client for the in-process MCP server, shared by all integration tests."""
+    async with Client(mcp) as client:
+        yield client
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--integration",
+        action="store_true",
+        default=False,
+        help="Also run the integration and e2e tests, which need the real registries, GitHub, mise and Docker",
+    )
+    parser.addoption(
+        "--reuse-container",
+        action="store_true",
+        default=False,
+        help="Keep the e2e Docker container running after the tests, and reuse it in later test runs "
+             "(as long as the image is unchanged)",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip the integration (and e2e) tests, unless --integration is given."""
+    if config.getoption("--integration"):
+        return
+
+    skip_integration = pytest.mark.skip(reason="queries the real registries, run with --integration")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
+
+
+@pytest.fixture(scope="session")
+def docker_container_base_url(request: pytest.FixtureRequest) -> Generator[str, None, None]:
+    """Build and run the Docker container once per test session, then clean up after tests.
+
+    With --reuse-container, a container left running by a previous test run (of the same image) is reused,
+    and the container is kept running after the tests.
+
+    Yields:
+        base_url for the running container
+    """
+    port = 8000
+    project_root = Path(__file__).parent.parent
+    # Tag the image with the hash of its build context, so that an unchanged image is not rebuilt
+    image_tag = f"package-version-check-mcp:test-{compute_build_context_hash(project_root)}"
+
+    image_exists = subprocess.run(
+        ["docker", "image", "inspect", image_tag],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    ).returncode == 0
+
+    if image_exists:
+        logger.info("Reusing existing Docker image: %s", image_tag)
+    else:
+        logger.info("Building Docker image from: %s", project_root)
+
+        # Build the Docker image using subprocess
+        # The build log is spooled to a temporary file (rather than kept in memory), and only read on failure
+        build_cmd = ["docker", "build", "-t", image_tag, str(project_root)]
+        with tempfile.TemporaryFile() as build_log:
+            build_result = subprocess.run(
+                build_cmd,
+                stdout=build_log,
+                stderr=subprocess.STDOUT,
+                # The Dockerfile's cache mounts require BuildKit (the default builder only since Docker 23)
+                env={**os.environ, "DOCKER_BUILDKIT": "1"},
+            )
+            if build_result.returncode != 0:
+                build_log.seek(0)
+                pytest.fail(f"Docker image build failed:\n{build_log.read().decode('utf-8', errors='replace')}")
+        logger.info("Docker image built successfully: %s", image_tag)
+
+    reuse_container = request.config.getoption("--reuse-container")
+    container_label = f"{CONTAINER_LABEL}={image_tag}"
+    container_id = ""
+    if reuse_container:
+        running_container_ids = subprocess.run(
+            ["docker", "ps", "-q", "--filter", f"label={container_label}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        if running_container_ids:
+            container_id = running_container_ids[0]
+            logger.info("Reusing running Docker container: %s", container_id)
+
+    if not container_id:
+        # Start the container with plain docker commands (testcontainers would additionally start its "ryuk" reaper
+        # container). Docker picks a free host port, which is bound to localhost only.
+        container_id = subprocess.run(
+            ["docker", "run", "-d", "--label", container_label, "-p", f"127.0.0.1::{port}", image_tag],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        logger.info("Docker container started: %s", container_id)
+
+    is_healthy = False
+    try:
+        # "docker port" prints the host address of the mapping, e.g. "127.0.0.1:49153"
+        port_mapping = subprocess.run(
+            ["docker", "port", container_id, str(port)],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.splitlines()[0]
+        host_port = port_mapping.rsplit(":", 1)[1]
+        base_url = f"http://127.0.0.1:{host_port}"
+
+        # Wait for the container to be healthy. Poll quickly at first (exponential backoff, capped at 1 second),
+        # so that the tests start as soon as the server is up.
+        startup_timeout = 30.0
+
+        deadline = time.monotonic() + startup_timeout
+        attempt = 0
+        # One client for all probes, so that the connection is reused once the server accepts it
+        with httpx.Client(timeout=2.0, transport=httpx.HTTPTransport(retries=0)) as probe_client:
+            while True:
+                try:
+                    response = probe_client.get(f"{base_url}/health")
+                    if response.status_code == 200:
+                        logger.info("Container is healthy and responding at %s", base_url)
+                        is_healthy = True
+                        break
+                except (httpx.RequestError, httpx.TimeoutException) as e:
+                    logger.debug("Waiting for container to be ready (attempt %d): %s", attempt + 1, e)
+
+                if time.monotonic() >= deadline:
+                    break
+                time.sleep(min(0.05 * 2 ** attempt, 1.0))
+                attempt += 1
+
+        if not is_healthy:
+            # Container did not become healthy - print (the tail of) the logs for debugging
+            logs = subprocess.run(["docker", "logs", container_id], capture_output=True)
+            stdout_logs = logs.stdout[-MAX_CONTAINER_LOG_BYTES:].decode('utf-8', errors='replace')
+            stderr_logs = logs.stderr[-MAX_CONTAINER_LOG_BYTES:].decode('utf-8', errors='replace')
+
+            logger.error("Container failed to become healthy. Stdout logs:\n%s", stdout_logs)
+            logger.error("Container stderr logs:\n%s", stderr_logs)
+
+            pytest.fail(
+                f"Container did not become healthy in time.\n\n"
+                f"=== STDOUT ===\n{stdout_logs}\n\n"
+                f"=== STDERR ===\n{stderr_logs}"
+            )
+
+        yield base_url
+    finally:
+        # An unhealthy container is always removed, so that the next run does not reuse it
+        if not reuse_container or not is_healthy:
+            subprocess.run(["docker", "rm", "-f", container_id], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            logger.info("Docker cleanup completed")
@@ -3,17 +3,11 @@
 import pytest
 from fastmcp import Client
 
-from package_version_check_mcp.main import (
-    mcp,
-)
 from package_version_check_mcp.get_github_actions_pkg.structs import GetGitHubActionVersionsResponse
 
 
-@pytest.fixture
-async def mcp_client():
-    """Create a FastMCP client for testing."""
-    async with Client(mcp) as client:
-        yield client
+# These tests query the real GitHub API
+pytestmark = pytest.mark.integration
 
 
 @pytest.mark.parametrize("include_readme", [False, True])
@@ -48,13 +42,9 @@ async def test_get_github_action_versions_readme(mcp_client: Client, include_rea
         assert action_data.readme is None
 
 
-@pytest.mark.parametrize("action_names", [
-    ["actions/checkout"],
-    ["actions/checkout", "actions/setup-python"],
-    ["actions/checkout", "actions/setup-python", "actions/setup-node"],
-])
-async def test_get_github_action_versions_multiple(mcp_client: Client, action_names: list[str]):
-    """Test fetching multiple GitHub actions."""
+async def test_get_github_action_versions_multiple(mcp_client: Client):
+    """Test fetching multiple GitHub actions in a single tool call."""
+    action_names = ["actions/checkout", "actions/setup-python", "actions/setup-node"]
     result = await mcp_client.call_tool(
         name="get_github_action_versions_and_args",
         arguments={
@@ -65,17 +55,14 @@ async def test_get_github_action_versions_multiple(mcp_client: Client, action_na
 
     assert result.structured_content is not None
     response = GetGitHubActionVersionsResponse.model_validate(result.structured_content)
-    assert len(response.result) == len(action_names)
-    assert len(response.lookup_errors) == 0
-
-    names = {action.name for action in response.result}
-    assert names == set(action_names)
+    assert len(response.lookup_errors) == 0, f"Unexpected lookup errors: {response.lookup_errors}"
+    assert [action.name for action in response.result] == action_names
 
     for action_data in response.result:
-        assert action_data.latest_version.startswith("v")
-        assert action_data.digest is not None
-        assert len(action_data.digest) == 40  # SHA-1 hash is 40 hex characters
-        assert "runs" in action_data.metadata
+        assert action_data.latest_version.startswith("v"), f"Failed: {action_data.name}"
+        assert action_data.digest is not None, f"Failed: {action_data.name}"
+        assert len(action_data.digest) == 40, f"Failed: {action_data.name}"  # SHA-1 hash is 40 hex characters
+        assert "runs" in action_data.metadata, f"Failed: {action_data.name}"
 
 
 @pytest.mark.parametrize("action_name,error_substring", [
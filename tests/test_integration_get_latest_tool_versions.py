@@ -3,45 +3,32 @@
 import pytest
 from fastmcp import Client
 
-from package_version_check_mcp.main import mcp
 from package_version_check_mcp.get_latest_tools_pkg.structs import GetLatestToolVersionsResponse
 
 
-@pytest.fixture
-async def mcp_client():
-    """Create a FastMCP client for testing."""
-    async with Client(mcp) as client:
-        yield client
+# These tests run the real mise binary, which queries the tools' release sources
+pytestmark = pytest.mark.integration
 
 
-@pytest.mark.parametrize("tool_name", [
-    "terraform",
-    "gradle",
-    "maven",
-    "kubectl",
-    "helm",
-    "node",
-    "python",
-    "java",
-    "go",
-])
-async def test_get_latest_tool_versions_success(mcp_client: Client, tool_name):
-    """Test fetching valid tool versions from mise."""
+async def test_get_latest_tool_versions_success(mcp_client: Client):
+    """Test fetching valid tool versions from mise, all in a single tool call."""
+    tool_names = ["terraform", "gradle", "maven", "kubectl", "helm", "node", "python", "java", "go"]
     result = await mcp_client.call_tool(
         name="get_latest_tool_versions",
         arguments={
-            "tool_names": [tool_name]
+            "tool_names": tool_names
         }
     )
 
     assert result.structured_content is not None
     response = GetLatestToolVersionsResponse.model_validate(result.structured_content)
-    assert len(response.result) == 1
-    assert response.result[0].tool_name == tool_name
-    assert "." in response.result[0].latest_version
-    # Ensure the version starts with a digit (not vendor-specific like "zulu-")
-    assert response.result[0].latest_version[0].isdigit()
-    assert len(response.lookup_errors) == 0
+    assert len(response.lookup_errors) == 0, f"Unexpected lookup errors: {response.lookup_errors}"
+    assert [r.tool_name for r in response.result] == tool_names
+
+    for result_item in response.result:
+        assert "." in result_item.latest_version, f"Failed: {result_item.tool_name}"
+        # Ensure the version starts with a digit (not vendor-specific like "zulu-")
+        assert result_item.latest_version[0].isdigit(), f"Failed: {result_item.tool_name}"
 
 
 @pytest.mark.parametrize("tool_name", [
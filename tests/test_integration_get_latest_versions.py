@@ -3,21 +3,15 @@
 import pytest
 from fastmcp import Client
 
-from package_version_check_mcp.main import (
-    mcp,
-)
 from package_version_check_mcp.get_latest_versions_pkg.structs import Ecosystem, PackageVersionRequest, \
     GetLatestVersionsResponse
 
 
-@pytest.fixture
-async def mcp_client():
-    """Create a FastMCP client for testing."""
-    async with Client(mcp) as client:
-        yield client
+# These tests query the real package registries
+pytestmark = pytest.mark.integration
 
 
-@pytest.mark.parametrize("ecosystem,package_name", [
+SUCCESS_CASES = [
     (Ecosystem.NPM, "express"),
     (Ecosystem.PyPI, "requests"),
     (Ecosystem.Docker, "index.docker.io/library/busybox"),
@@ -42,78 +36,85 @@ async def mcp_client():
     (Ecosystem.PHP, "monolog/monolog"),
     (Ecosystem.PHP, "laravel/framework"),
     (Ecosystem.PHP, "symfony/console"),
-])
-async def test_get_latest_package_versions_success(mcp_client: Client, ecosystem, package_name):
-    """Test fetching valid package versions from different ecosystems."""
+]
+
+NOT_FOUND_CASES = [
+    (Ecosystem.NPM, "this-package-definitely-does-not-exist-12345678"),
+    (Ecosystem.PyPI, "this-package-definitely-does-not-exist-12345678"),
+    (Ecosystem.NuGet, "this-package-definitely-does-not-exist-12345678"),
+    (Ecosystem.MavenGradle, "org.nonexistent:this-package-definitely-does-not-exist-12345678"),
+    (Ecosystem.Helm, "https://charts.bitnami.com/bitnami/nonexistent-chart-12345"),
+    (Ecosystem.Helm, "oci://ghcr.io/nonexistent-org-12345/nonexistent-chart-12345"),
+    (Ecosystem.TerraformProvider, "nonexistent-namespace-12345/nonexistent-provider-12345"),
+    (Ecosystem.TerraformModule, "nonexistent-namespace-12345/nonexistent-module-12345/aws"),
+    (Ecosystem.Go, "github.com/nonexistent-user-12345/nonexistent-repo-12345"),
+    (Ecosystem.PHP, "nonexistent-vendor-12345/nonexistent-package-12345"),
+]
+
+
+async def test_get_latest_package_versions_success(mcp_client: Client):
+    """Test fetching valid package versions from different ecosystems, all in a single tool call."""
     result = await mcp_client.call_tool(
         name="get_latest_package_versions",
         arguments={
             "packages": [
                 PackageVersionRequest(ecosystem=ecosystem, package_name=package_name)
+                for ecosystem, package_name in SUCCESS_CASES
             ]
         }
     )
 
     assert result.structured_content is not None
     response = GetLatestVersionsResponse.model_validate(result.structured_content)
-    assert len(response.result) == 1
-    assert response.result[0].ecosystem is ecosystem
-    assert response.result[0].package_name == package_name
-    assert "." in response.result[0].latest_version
+    assert len(response.lookup_errors) == 0, f"Unexpected lookup errors: {response.lookup_errors}"
+    assert [(r.ecosystem, r.package_name) for r in response.result] == SUCCESS_CASES
 
-    if ecosystem is Ecosystem.Docker:
-        assert response.result[0].digest is not None
-        assert response.result[0].digest.startswith("sha256:")
+    for package_result in response.result:
+        ecosystem = package_result.ecosystem
+        failure_message = f"Failed: {ecosystem.value} {package_result.package_name}"
+        assert "." in package_result.latest_version, failure_message
 
-    if ecosystem is Ecosystem.MavenGradle:
-        # Maven/Gradle doesn't provide digest or published_on
-        assert response.result[0].digest is None
-        assert response.result[0].published_on is None
+        if ecosystem is Ecosystem.Docker:
+            assert package_result.digest is not None, failure_message
+            assert package_result.digest.startswith("sha256:"), failure_message
 
-    if ecosystem is Ecosystem.Go:
-        assert response.result[0].published_on is not None
-        assert response.result[0].digest is not None
+        if ecosystem is Ecosystem.MavenGradle:
+            # Maven/Gradle doesn't provide digest or published_on
+            assert package_result.digest is None, failure_message
+            assert package_result.published_on is None, failure_message
 
-    if ecosystem is Ecosystem.PHP:
-        # PHP packages should have published_on but no digest
-        assert response.result[0].published_on is not None
-        assert response.result[0].digest is None
+        if ecosystem is Ecosystem.Go:
+            assert package_result.published_on is not None, failure_message
+            assert package_result.digest is not None, failure_message
 
-    assert len(response.lookup_errors) == 0
+        if ecosystem is Ecosystem.PHP:
+            # PHP packages should have published_on but no digest
+            assert package_result.published_on is not None, failure_message
+            assert package_result.digest is None, failure_message
 
 
-@pytest.mark.parametrize("ecosystem,package_name", [
-    (Ecosystem.NPM, "this-package-definitely-does-not-exist-12345678"),
-    (Ecosystem.PyPI, "this-package-definitely-does-not-exist-12345678"),
-    (Ecosystem.NuGet, "this-package-definitely-does-not-exist-12345678"),
-    (Ecosystem.MavenGradle, "org.nonexistent:this-package-definitely-does-not-exist-12345678"),
-    (Ecosystem.Helm, "https://charts.bitnami.com/bitnami/nonexistent-chart-12345"),
-    (Ecosystem.Helm, "oci://ghcr.io/nonexistent-org-12345/nonexistent-chart-12345"),
-    (Ecosystem.TerraformProvider, "nonexistent-namespace-12345/nonexistent-provider-12345"),
-    (Ecosystem.TerraformModule, "nonexistent-namespace-12345/nonexistent-module-12345/aws"),
-    (Ecosystem.Go, "github.com/nonexistent-user-12345/nonexistent-repo-12345"),
-    (Ecosystem.PHP, "nonexistent-vendor-12345/nonexistent-package-12345"),
-])
-async def test_get_latest_package_versions_not_found(mcp_client: Client, ecosystem, package_name):
-    """Test fetching non-existent packages from different ecosystems."""
+async def test_get_latest_package_versions_not_found(mcp_client: Client):
+    """Test fetching non-existent packages from different ecosystems, all in a single tool call."""
     result = await mcp_client.call_tool(
         name="get_latest_package_versions",
         arguments={
             "packages": [
                 PackageVersionRequest(ecosystem=ecosystem, package_name=package_name)
+                for ecosystem, package_name in NOT_FOUND_CASES
             ]
         }
     )
 
     assert result.structured_content is not None
     response = GetLatestVersionsResponse.model_validate(result.structured_content)
-    assert len(response.result) == 0
-    assert len(response.lookup_errors) == 1
-    assert response.lookup_errors[0].ecosystem is ecosystem
-    assert response.lookup_errors[0].package_name == package_name
-    # Different registries return different errors (404 Not Found, 403 Forbidden, etc.)
-    error_lower = response.lookup_errors[0].error.lower()
-    assert "not found" in error_lower or "403" in error_lower or "forbidden" in error_lower
+    assert len(response.result) == 0, f"Unexpected results: {response.result}"
+    assert [(e.ecosystem, e.package_name) for e in response.lookup_errors] == NOT_FOUND_CASES
+
+    for lookup_error in response.lookup_errors:
+        # Different registries return different errors (404 Not Found, 403 Forbidden, etc.)
+        error_lower = lookup_error.error.lower()
+        assert "not found" in error_lower or "403" in error_lower or "forbidden" in error_lower, \
+            f"Failed: {lookup_error.ecosystem.value} {lookup_error.package_name}: {lookup_error.error}"
 
 
 async def test_get_latest_package_versions_mixed_success_and_failure(mcp_client: Client):
@@ -176,14 +177,12 @@ async def test_get_latest_package_versions_multiple_packages(mcp_client: Client)
     assert len(response.result) == 4
     assert len(response.lookup_errors) == 0
 
-    # Verify all packages are present
-    package_names = {pkg.package_name for pkg in response.result}
-    assert package_names == {"express", "react", "requests", "flask"}
-
-    # Verify all have valid versions
+    # Verify all packages are present, with valid versions
+    package_names = set()
     for pkg in response.result:
-        assert pkg.latest_version != ""
-        assert "." in pkg.latest_version
+        package_names.add(pkg.package_name)
+        assert "." in pkg.latest_version, f"Failed: {pkg.package_name}"
+    assert package_names == {"express", "react", "requests", "flask"}
 
 
 @pytest.mark.parametrize("package_name,version_hint,expected_suffix", [
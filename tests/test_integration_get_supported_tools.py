@@ -3,14 +3,9 @@
 import pytest
 from fastmcp import Client
 
-from package_version_check_mcp.main import mcp
 
-
-@pytest.fixture
-async def mcp_client():
-    """Create a FastMCP client for testing."""
-    async with Client(mcp) as client:
-        yield client
+# These tests run the real mise binary
+pytestmark = pytest.mark.integration
 
 
 async def test_get_supported_tools(mcp_client: Client):
@@ -21,11 +16,8 @@ async def test_get_supported_tools(mcp_client: Client):
     )
 
     assert result.structured_content is not None
-    # The MCP framework wraps the response in a dict
-    if isinstance(result.structured_content, dict):
-        supported_tools = result.structured_content.get("result", result.structured_content)
-    else:
-        supported_tools = result.structured_content
+    # The MCP framework wraps the response in a dict (structured content is always a JSON object)
+    supported_tools = result.structured_content.get("result", result.structured_content)
 
     assert isinstance(supported_tools, list)
     assert len(supported_tools) > 0
@@ -615,3 +615,519 @@ def test_compare_semver(version1, version2, expected_result, test_description):
     """Test compare_semver with various version comparisons."""
     result = compare_semver(version1, version2)
     assert result == expected_result, f"Failed: {test_description} (got {result}, expected {expected_result})"
+
+
+# ============================================================================
+# TTLCache tests
+# ============================================================================
+
+import asyncio
+
+import httpx
+
+from package_version_check_mcp.get_latest_versions_pkg.utils.ttl_cache import TTLCache
+
+
+def test_ttl_cache_fresh_and_stale():
+    """Test that TTLCache reports whether entries are still fresh."""
+    cache: TTLCache[str] = TTLCache()
+    assert cache.get("key", ttl=60) == (None, False)
+
+    cache.set("key", "value")
+    assert cache.get("key", ttl=60) == ("value", True)
+    assert cache.get("key", ttl=0) == ("value", False)
+
+    cache.clear()
+    assert cache.get("key", ttl=60) == (None, False)
+
+
+def test_ttl_cache_evicts_least_recently_used_entry():
+    """Test that TTLCache evicts the least recently used entry once it is full."""
+    cache: TTLCache[int] = TTLCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a", ttl=60)
+    cache.set("c", 3)
+
+    assert cache.get("b", ttl=60) == (None, False)
+    assert cache.get("a", ttl=60) == (1, True)
+    assert cache.get("c", ttl=60) == (3, True)
+
+
+async def test_fetch_package_version_coalesces_concurrent_lookups(monkeypatch):
+    """Test that concurrent lookups of the same package share a single registry query, including its error."""
+    from package_version_check_mcp.get_latest_versions_pkg import dispatcher
+    from package_version_check_mcp.get_latest_versions_pkg.structs import Ecosystem, PackageVersionRequest
+
+    fetch_count = 0
+
+    async def fetch_uncached(request):
+        nonlocal fetch_count
+        fetch_count += 1
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    monkeypatch.setattr(dispatcher, "_fetch_package_version_uncached", fetch_uncached)
+    request = PackageVersionRequest(ecosystem=Ecosystem.NPM, package_name="single-flight-test")
+
+    results = await asyncio.gather(*[dispatcher.fetch_package_version(request) for _ in range(5)])
+    assert [result.error for result in results] == ["Failed to fetch package version: boom"] * 5
+    assert fetch_count == 1
+
+
+def make_http_status_error(status_code: int) -> httpx.HTTPStatusError:
+    """Create the exception that httpx raises for a response with the given (error) status code."""
+    request = httpx.Request("GET", "https://registry.example.com/package")
+    return httpx.HTTPStatusError("error", request=request, response=httpx.Response(status_code, request=request))
+
+
+async def test_fetch_package_version_caches_not_found_errors(monkeypatch):
+    """Test that "package not found" errors are served from the cache, but other errors are not."""
+    from package_version_check_mcp.get_latest_versions_pkg import dispatcher
+    from package_version_check_mcp.get_latest_versions_pkg.structs import Ecosystem, PackageVersionRequest
+
+    fetch_count = 0
+
+    async def fetch_uncached(request):
+        nonlocal fetch_count
+        fetch_count += 1
+        raise make_http_status_error(500 if request.package_name == "failing-test" else 404)
+
+    monkeypatch.setattr(dispatcher, "_fetch_package_version_uncached", fetch_uncached)
+    not_found = PackageVersionRequest(ecosystem=Ecosystem.NPM, package_name="not-found-cache-test")
+    failing = PackageVersionRequest(ecosystem=Ecosystem.NPM, package_name="failing-test")
+
+    for _ in range(2):
+        assert (await dispatcher.fetch_package_version(not_found)).error.endswith("not found")
+        assert (await dispatcher.fetch_package_version(failing)).error.startswith("HTTP error 500")
+    assert fetch_count == 3
+
+
+@pytest.mark.parametrize(
+    "error,max_stale_seconds,serves_stale,test_description",
+    [
+        (httpx.ConnectTimeout("timed out"), 3600.0, True, "Timeout"),
+        (httpx.ConnectError("refused"), 3600.0, True, "Connection error"),
+        (make_http_status_error(503), 3600.0, True, "Server error"),
+        (httpx.ConnectError("refused"), 0.0, False, "Expired longer than the maximum stale age"),
+        (make_http_status_error(404), 3600.0, False, "Not found"),
+        (make_http_status_error(403), 3600.0, False, "Client error"),
+        (ValueError("unexpected document"), 3600.0, False, "Other error"),
+    ],
+)
+async def test_fetch_package_version_serves_stale_results_on_transient_errors(
+    monkeypatch, error, max_stale_seconds, serves_stale, test_description
+):
+    """Test that an expired result is only served if the lookup fails transiently, and for a limited time."""
+    from package_version_check_mcp.get_latest_versions_pkg import dispatcher
+    from package_version_check_mcp.get_latest_versions_pkg.structs import (
+        Ecosystem,
+        PackageVersionRequest,
+        PackageVersionResult,
+    )
+
+    package_name = f"stale-test-{test_description}"
+    outcomes = [PackageVersionResult(ecosystem=Ecosystem.NPM, package_name=package_name, latest_version="1.0.0"), error]
+
+    async def fetch_uncached(request):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(dispatcher, "_fetch_package_version_uncached", fetch_uncached)
+    monkeypatch.setattr(dispatcher, "DEFAULT_CACHE_TTL_SECONDS", 0.0)
+    monkeypatch.setattr(dispatcher, "MAX_STALE_SECONDS", max_stale_seconds)
+    request = PackageVersionRequest(ecosystem=Ecosystem.NPM, package_name=package_name)
+
+    assert (await dispatcher.fetch_package_version(request)).latest_version == "1.0.0"
+    result = await dispatcher.fetch_package_version(request)
+    assert isinstance(result, PackageVersionResult) == serves_stale, f"Failed: {test_description}"
+
+
+# ============================================================================
+# ConditionalGetCache tests
+# ============================================================================
+
+from package_version_check_mcp.get_latest_versions_pkg.utils.conditional_get import ConditionalGetCache
+
+
+def test_conditional_get_cache_stores_validators():
+    """Test that ConditionalGetCache turns response validators into revalidation request headers."""
+    cache: ConditionalGetCache[str] = ConditionalGetCache()
+    assert cache.lookup("https://example.com/a") is None
+
+    response = httpx.Response(200, headers={"ETag": '"abc"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"})
+    cache.store("https://example.com/a", response, "value")
+    revalidation = cache.lookup("https://example.com/a")
+    assert revalidation is not None
+    assert revalidation.headers == {"If-None-Match": '"abc"', "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    assert revalidation.value == "value"
+
+    # Responses without validators cannot be revalidated
+    cache.store("https://example.com/b", httpx.Response(200), "value")
+    assert cache.lookup("https://example.com/b") is None
+
+
+def test_conditional_get_cache_evicts_oldest_entry():
+    """Test that ConditionalGetCache evicts the least recently stored entry once it is full."""
+    cache: ConditionalGetCache[int] = ConditionalGetCache(max_entries=2)
+    response = httpx.Response(200, headers={"ETag": '"abc"'})
+    cache.store("a", response, 1)
+    cache.store("b", response, 2)
+    cache.store("a", response, 3)
+    cache.store("c", response, 4)
+
+    assert cache.lookup("b") is None
+    assert cache.lookup("a").value == 3
+    assert cache.lookup("c").value == 4
+
+
+# ============================================================================
+# PyPI parse_distribution_version tests
+# ============================================================================
+
+from package_version_check_mcp.get_latest_versions_pkg.fetchers.pypi import parse_distribution_version
+
+
+@pytest.mark.parametrize(
+    "filename,expected_version,test_description",
+    [
+        ("requests-2.32.3-py3-none-any.whl", "2.32.3", "Wheel"),
+        ("requests-2.32.3.tar.gz", "2.32.3", "Sdist"),
+        ("zope.interface-7.0rc1.tar.gz", "7.0rc1", "Sdist with dotted name and prerelease"),
+        ("numpy-2.1.0-cp312-cp312-manylinux_2_17_x86_64.manylinux2014_x86_64.whl", "2.1.0", "Platform wheel"),
+        ("foo-1.0-1build-py3-none-any.whl", "1.0", "Wheel with build tag"),
+        ("foo-1.0-py3-any.whl", None, "Wheel with missing tag component"),
+        ("foo-notaversion.zip", None, "Sdist with invalid version"),
+        ("setuptools-0.6c11-py2.7.egg", None, "Legacy egg is ignored"),
+        ("invalid", None, "Invalid filename"),
+    ],
+)
+def test_parse_distribution_version(filename, expected_version, test_description):
+    """Test parse_distribution_version with various distribution filenames."""
+    version = parse_distribution_version(filename)
+    if expected_version is None:
+        assert version is None, f"Failed: {test_description}"
+    else:
+        assert str(version) == expected_version, f"Failed: {test_description}"
+
+
+# ============================================================================
+# parse_docker_tag tests
+# ============================================================================
+
+from package_version_check_mcp.get_latest_versions_pkg.utils.version_parser import parse_docker_tag, ParsedDockerTag
+
+
+@pytest.mark.parametrize(
+    "tag,expected,test_description",
+    [
+        ("1.2.3", ParsedDockerTag((1, 2, 3) + (0,) * 7, "", "", "1.2.3"), "Plain version"),
+        ("v1.2", ParsedDockerTag((1, 2) + (0,) * 8, "", "", "v1.2"), "Leading v"),
+        ("3.8.0b1-alpine3.18", ParsedDockerTag((3, 8, 0) + (0,) * 7, "alpine3.18", "b1", "3.8.0b1-alpine3.18"), "Prerelease with suffix"),
+        ("latest", None, "Special tag"),
+        ("Nightly", None, "Special tag in mixed case"),
+        ("abc123def", None, "Commit hash"),
+        ("20260202", None, "Date-based tag"),
+        ("999", ParsedDockerTag((999,) + (0,) * 9, "", "", "999"), "Single number below 1000"),
+        ("1..2", None, "Empty version part"),
+        ("", None, "Empty tag"),
+    ],
+)
+def test_parse_docker_tag(tag, expected, test_description):
+    """Test parse_docker_tag with various tags."""
+    assert parse_docker_tag(tag) == expected, f"Failed: {test_description}"
+
+
+# ============================================================================
+# Docker tag list pagination tests
+# ============================================================================
+
+from types import SimpleNamespace
+
+from aiohttp import ServerDisconnectedError
+from docker_registry_client_async import ImageName
+from yarl import URL
+
+from package_version_check_mcp.get_latest_versions_pkg.fetchers import docker
+
+
+class FakeRegistryClient:
+    """Registry client stub that serves the given tag list pages, linking each page to the next one."""
+
+    def __init__(self, pages: list[list[str]]):
+        self.pages = pages
+        self.manifest_requests: list[str] = []
+
+    async def get_tag_list(self, image_name, **kwargs):
+        page_index = int(kwargs["last"][0]) if "last" in kwargs else 0
+        links = {}
+        if page_index + 1 < len(self.pages):
+            links["next"] = {"url": URL(f"/v2/tags/list?n=1000&last={page_index + 1}")}
+        return SimpleNamespace(
+            tags=[ImageName.parse(f"busybox:{tag}") for tag in self.pages[page_index]],
+            client_response=SimpleNamespace(links=links),
+        )
+
+    async def head_manifest(self, image_name):
+        self.manifest_requests.append(image_name.tag)
+        return SimpleNamespace(digest=f"sha256:{image_name.tag}")
+
+
+@pytest.mark.parametrize(
+    "pages,expected_first_pages,test_description",
+    [
+        ([["1.0", "1.1"]], [], "Single page"),
+        ([["1.0", "1.1"], ["1.2"]], [["1.0", "1.1"]], "Paginated"),
+    ],
+)
+async def test_get_docker_image_tags_calls_on_first_page_only_when_paginated(pages, expected_first_pages,
+                                                                             test_description):
+    """Test that the first-page callback only runs if further pages have to be retrieved."""
+    first_pages = []
+    tags = await docker.get_docker_image_tags(ImageName.parse("busybox"), FakeRegistryClient(pages),
+                                              on_first_page=first_pages.append)
+    assert tags == [tag for page in pages for tag in page], f"Failed: {test_description}"
+    assert first_pages == expected_first_pages, f"Failed: {test_description}"
+
+
+@pytest.mark.parametrize(
+    "pages,expected_tag,test_description",
+    [
+        ([["1.0-alpine", "1.2-alpine", "1.3"]], "1.2-alpine", "Single page"),
+        ([["1.0-alpine", "1.2-alpine"], ["1.1-alpine"]], "1.2-alpine", "Speculated tag is the latest one"),
+        ([["1.0-alpine", "1.1-alpine"], ["1.2-alpine"]], "1.2-alpine", "Speculated tag is outdated"),
+    ],
+)
+async def test_fetch_docker_version_speculative_digest(monkeypatch, pages, expected_tag, test_description):
+    """Test that the manifest digest of the latest tag is requested exactly once, speculated or not."""
+    registry_client = FakeRegistryClient(pages)
+    monkeypatch.setattr(docker, "get_registry_client", lambda: registry_client)
+
+    result = await docker.fetch_docker_version("busybox", "1.0-alpine")
+
+    assert (result.latest_version, result.digest) == (expected_tag, f"sha256:{expected_tag}"), \
+        f"Failed: {test_description}"
+    assert registry_client.manifest_requests.count(expected_tag) == 1, f"Failed: {test_description}"
+
+
+async def test_fetch_docker_version_without_digest_if_manifest_request_fails(monkeypatch):
+    """Test that a dropped registry connection while fetching the optional manifest digest yields no digest."""
+    registry_client = FakeRegistryClient([["1.0", "1.1"]])
+
+    async def head_manifest(image_name):
+        raise ServerDisconnectedError()
+
+    monkeypatch.setattr(registry_client, "head_manifest", head_manifest)
+    monkeypatch.setattr(docker, "get_registry_client", lambda: registry_client)
+
+    result = await docker.fetch_docker_version("busybox")
+
+    assert (result.latest_version, result.digest) == ("1.1", None)
+
+
+# ============================================================================
+# RetryingTransport tests
+# ============================================================================
+
+from package_version_check_mcp.get_latest_versions_pkg.utils.http_client import RetryingTransport
+
+
+async def test_retrying_transport_retries_transient_failures():
+    """Test that RetryingTransport retries connect errors and 503 responses, but returns other responses as-is."""
+    outcomes = [httpx.ConnectError("refused"), httpx.Response(503), httpx.Response(404)]
+
+    def handler(request):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    async with httpx.AsyncClient(transport=RetryingTransport(httpx.MockTransport(handler))) as client:
+        response = await client.get("https://example.com/")
+
+    assert response.status_code == 404
+    assert outcomes == []
+
+
+# ============================================================================
+# Shared HTTP client tests
+# ============================================================================
+
+import threading
+
+from package_version_check_mcp.get_latest_versions_pkg.utils import http_client
+
+
+async def test_get_http_client_closes_client_of_previous_loop(monkeypatch):
+    """Test that the shared client of another (still running) event loop is closed when it is replaced."""
+    monkeypatch.setattr(http_client, "_client", None)
+    monkeypatch.setattr(http_client, "_client_loop", None)
+
+    async def get_client() -> httpx.AsyncClient:
+        return http_client.get_http_client()
+
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever)
+    thread.start()
+    try:
+        old_client = await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(get_client(), other_loop))
+        new_client = http_client.get_http_client()
+        assert new_client is not old_client
+
+        for _ in range(100):
+            if old_client.is_closed:
+                break
+            await asyncio.sleep(0.01)
+        assert old_client.is_closed
+        await new_client.aclose()
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join()
+        other_loop.close()
+
+
+async def test_get_registry_client_closes_client_of_previous_loop(monkeypatch):
+    """Test that the shared Docker registry client of another (still running) event loop is closed when replaced."""
+    monkeypatch.setattr(docker, "_registry_client", None)
+    monkeypatch.setattr(docker, "_registry_client_loop", None)
+
+    async def get_client():
+        registry_client = docker.get_registry_client()
+        # Open the aiohttp session, like the first registry request would
+        await registry_client._get_client_session()
+        return registry_client
+
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever)
+    thread.start()
+    try:
+        old_client = await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(get_client(), other_loop))
+        new_client = docker.get_registry_client()
+        assert new_client is not old_client
+
+        for _ in range(100):
+            if old_client.client_session is None:
+                break
+            await asyncio.sleep(0.01)
+        assert old_client.client_session is None
+        await new_client.close()
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join()
+        other_loop.close()
+
+
+async def test_get_registry_client_replaced_after_token_max_age(monkeypatch):
+    """Test that the shared Docker registry client is replaced (and later closed) once its tokens are too old."""
+    monkeypatch.setattr(docker, "_registry_client", None)
+    monkeypatch.setattr(docker, "_registry_client_loop", None)
+    monkeypatch.setattr(docker, "RETIRED_REGISTRY_CLIENT_CLOSE_DELAY_SECONDS", 0.0)
+
+    old_client = docker.get_registry_client()
+    await old_client._get_client_session()
+    assert docker.get_registry_client() is old_client
+
+    monkeypatch.setattr(docker, "REGISTRY_TOKEN_MAX_AGE_SECONDS", 0.0)
+    new_client = docker.get_registry_client()
+    assert new_client is not old_client
+
+    for _ in range(100):
+        if old_client.client_session is None:
+            break
+        await asyncio.sleep(0.01)
+    assert old_client.client_session is None
+    assert not docker._retired_registry_clients
+    await new_client.close()
+
+
+# ============================================================================
+# get_latest_package_versions tests with mocked registries
+# ============================================================================
+
+import respx
+from fastmcp import Client
+
+from package_version_check_mcp.get_latest_versions_pkg.fetchers.pypi import SIMPLE_API_JSON_CONTENT_TYPE
+from package_version_check_mcp.get_latest_versions_pkg.structs import Ecosystem, PackageVersionRequest, \
+    GetLatestVersionsResponse
+
+
+@respx.mock
+async def test_get_latest_package_versions_mocked_registries(mcp_client: Client):
+    """Test the get_latest_package_versions tool against stubbed NPM and PyPI registry responses."""
+    # The package names are unique to this test, because the server caches lookup results in-process
+    respx.get("https://registry.npmjs.org/mocked-npm-package").mock(return_value=httpx.Response(200, json={
+        "dist-tags": {"latest": "2.0.0"},
+        "time": {"1.0.0": "2024-01-01T00:00:00.000Z", "2.0.0": "2025-01-01T00:00:00.000Z"},
+    }))
+    respx.get("https://pypi.org/simple/mocked-pypi-package/").mock(return_value=httpx.Response(
+        200,
+        headers={"Content-Type": SIMPLE_API_JSON_CONTENT_TYPE},
+        json={
+            "versions": ["1.0.0", "1.1.0", "2.0.0b1"],
+            "files": [
+                {"filename": "mocked_pypi_package-1.0.0.tar.gz", "upload-time": "2024-01-01T00:00:00Z",
+                 "hashes": {"sha256": "aaa"}},
+                # Listed before the sdist, but uploaded later
+                {"filename": "mocked_pypi_package-1.1.0-py3-none-any.whl", "upload-time": "2024-06-02T00:00:00Z",
+                 "hashes": {"sha256": "ddd"}},
+                {"filename": "mocked_pypi_package-1.1.0.tar.gz", "upload-time": "2024-06-01T00:00:00Z",
+                 "hashes": {"sha256": "bbb"}},
+                {"filename": "mocked_pypi_package-2.0.0b1.tar.gz", "upload-time": "2025-01-01T00:00:00Z",
+                 "hashes": {"sha256": "ccc"}},
+            ],
+        },
+    ))
+    respx.get("https://registry.npmjs.org/mocked-missing-npm-package").mock(return_value=httpx.Response(404))
+
+    result = await mcp_client.call_tool(
+        name="get_latest_package_versions",
+        arguments={
+            "packages": [
+                PackageVersionRequest(ecosystem=Ecosystem.NPM, package_name="mocked-npm-package"),
+                PackageVersionRequest(ecosystem=Ecosystem.PyPI, package_name="mocked-pypi-package"),
+                PackageVersionRequest(ecosystem=Ecosystem.NPM, package_name="mocked-missing-npm-package"),
+            ]
+        }
+    )
+
+    response = GetLatestVersionsResponse.model_validate(result.structured_content)
+    npm_result, pypi_result = response.result
+    assert (npm_result.ecosystem, npm_result.latest_version) == (Ecosystem.NPM, "2.0.0")
+    assert npm_result.published_on == "2025-01-01T00:00:00.000Z"
+    # Pre-releases are skipped in favor of the highest stable version
+    assert (pypi_result.ecosystem, pypi_result.latest_version) == (Ecosystem.PyPI, "1.1.0")
+    assert pypi_result.digest == "sha256:bbb"
+    assert pypi_result.published_on == "2024-06-01T00:00:00Z"
+
+    assert len(response.lookup_errors) == 1
+    assert response.lookup_errors[0].package_name == "mocked-missing-npm-package"
+    assert "not found" in response.lookup_errors[0].error.lower()
+
+
+# ============================================================================
+# GitHub action file cache tests
+# ============================================================================
+
+from package_version_check_mcp.get_github_actions_pkg import functions as github_functions
+
+
+@respx.mock
+async def test_github_action_readme_cache_expires(monkeypatch):
+    """Test that cached READMEs of a (mutable) tag are fetched again once their TTL has passed."""
+    route = respx.get("https://raw.githubusercontent.com/mocked-owner/mocked-action/v1/README.md").mock(
+        side_effect=[httpx.Response(200, text="old"), httpx.Response(200, text="moved tag")]
+    )
+
+    async with httpx.AsyncClient() as client:
+        assert await github_functions.fetch_github_action_readme("mocked-owner", "mocked-action", "v1", client) == "old"
+        assert await github_functions.fetch_github_action_readme("mocked-owner", "mocked-action", "v1", client) == "old"
+        assert route.call_count == 1
+
+        monkeypatch.setattr(github_functions, "TAG_CONTENT_CACHE_TTL_SECONDS", 0.0)
+        assert await github_functions.fetch_github_action_readme(
+            "mocked-owner", "mocked-action", "v1", client
+        ) == "moved tag"
+        assert route.call_count == 2